@@ -1,8 +1,11 @@
 import time
 
 def count(end, start=0):
+    # sleep until the next whole second after the start, so printing doesn't add drift
+    next_tick = time.monotonic()
     for x in range(start, end+1):
         print(x)
-        time.sleep(1)
+        next_tick += 1
+        time.sleep(max(0, next_tick - time.monotonic()))
     print("DONE")
 count(30, 15)
\ No newline at end of file
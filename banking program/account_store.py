@@ -0,0 +1,144 @@
+# Many accounts that can be used from many threads at once
+# Every account has its own lock, so two threads only wait for each other when
+# they touch the same account. A transfer locks both accounts, always in
+# account id order, so two opposite transfers can never deadlock.
+#
+# The methods never await, so asyncio tasks can call them directly: the
+# account lock is only held for a few lines and never across an await.
+
+import contextlib
+import random
+import threading
+import time
+
+from ledger import Money, check_deposit, check_withdraw
+
+
+class Account:
+    def __init__(self, account_id, balance=0):
+        self.account_id = account_id
+        self.balance = Money.of(balance)
+        self.lock = threading.Lock()
+
+
+class AccountStore:
+    def __init__(self):
+        self.accounts = {}
+        # only used when opening an account, never for deposits or withdrawals
+        self.open_lock = threading.Lock()
+
+    def open(self, account_id, balance=0):
+        with self.open_lock:
+            if account_id in self.accounts:
+                raise ValueError(f"Account {account_id} already exists")
+            self.accounts[account_id] = Account(account_id, balance)
+
+    def get(self, account_id):
+        try:
+            return self.accounts[account_id]
+        except KeyError:
+            raise KeyError(f"No account {account_id}") from None
+
+    def balance(self, account_id):
+        return self.get(account_id).balance
+
+    def deposit(self, account_id, amount):
+        amount = Money.of(amount)
+        check_deposit(amount)
+        account = self.get(account_id)
+        with account.lock:
+            account.balance += amount
+            return account.balance
+
+    def withdraw(self, account_id, amount):
+        amount = Money.of(amount)
+        account = self.get(account_id)
+        with account.lock:
+            check_withdraw(amount, account.balance)
+            account.balance -= amount
+            return account.balance
+
+    def transfer(self, from_id, to_id, amount):
+        if from_id == to_id:
+            raise ValueError("Can't transfer to the same account")
+        amount = Money.of(amount)
+        check_deposit(amount)
+        sender = self.get(from_id)
+        receiver = self.get(to_id)
+
+        first, second = sorted((sender, receiver), key=lambda account: account.account_id)
+        with first.lock, second.lock:
+            check_withdraw(amount, sender.balance)
+            sender.balance -= amount
+            receiver.balance += amount
+
+    def total(self):
+        # a consistent total: every account is locked (in id order, like transfer)
+        # while adding up, so no money is counted twice or missed mid-transfer
+        with self.open_lock:
+            accounts = sorted(self.accounts.values(), key=lambda account: account.account_id)
+        with contextlib.ExitStack() as stack:
+            for account in accounts:
+                stack.enter_context(account.lock)
+            return sum(account.balance for account in accounts)
+
+
+def run_load(store, account_ids, operations, latencies, seed):
+    rng = random.Random(seed)
+    for _ in range(operations):
+        choice = rng.random()
+        start = time.perf_counter_ns()
+        try:
+            if choice < 0.4:
+                store.deposit(rng.choice(account_ids), 100)
+            elif choice < 0.7:
+                store.withdraw(rng.choice(account_ids), 50)
+            else:
+                from_id, to_id = rng.sample(account_ids, 2)
+                store.transfer(from_id, to_id, 25)
+        except ValueError:
+            pass  # insufficient funds is a normal outcome
+        latencies.append(time.perf_counter_ns() - start)
+
+
+def benchmark(threads=8, accounts=1_000, operations=50_000):
+    store = AccountStore()
+    account_ids = list(range(accounts))
+    for account_id in account_ids:
+        store.open(account_id, balance=1_000)
+
+    latencies = [[] for _ in range(threads)]
+    workers = [threading.Thread(target=run_load, args=(store, account_ids, operations, latencies[i], i))
+               for i in range(threads)]
+
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    seconds = time.perf_counter() - start
+
+    all_latencies = sorted(latency for thread in latencies for latency in thread)
+
+    def percentile(p):
+        return all_latencies[min(len(all_latencies) - 1, int(len(all_latencies) * p))] / 1000
+
+    return {"transactions_per_second": len(all_latencies) / seconds,
+            "p50_us": percentile(0.50),
+            "p99_us": percentile(0.99),
+            "p999_us": percentile(0.999),
+            "total": store.total()}
+
+
+def main():
+    results = benchmark()
+
+    print("******************************")
+    print(f"{results['transactions_per_second']:,.0f} transactions per second")
+    print(f"Latency p50 {results['p50_us']:.1f}us | p99 {results['p99_us']:.1f}us | p99.9 {results['p999_us']:.1f}us")
+    print(f"Total money in the bank Ksh.{results['total']:.2f}")
+    print("******************************")
+
+
+if __name__ == "__main__":
+    main()
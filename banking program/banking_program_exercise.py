@@ -1,10 +1,27 @@
+import os
+
+from ledger import Ledger, Money
+
+# deposits and withdrawals are kept here, so the balance is still there next time
+data_folder = os.path.join(os.path.dirname(__file__), "bank_data")
+
 def show_balance(balance):
     print("******************************")
     print(f"Your balance is Ksh.{balance:.2f}")
     print("******************************")
 
+def invalid_amount():
+    print("******************************")
+    print("That is an invalid amount")
+    print("******************************")
+    return 0
+
 def deposit():
-    amount = float(input("Enter amount to deposit in Ksh: "))
+    try:
+        # whole shillings and cents only, e.g. 500 or 120.50
+        amount = Money.of(input("Enter amount to deposit in Ksh: "))
+    except ValueError:
+        return invalid_amount()
 
     if amount < 0:
         print("******************************")
@@ -15,7 +32,10 @@ def deposit():
         return amount
 
 def withdraw(balance):
-    amount = float(input("Enter amount to withdraw in Ksh: "))
+    try:
+        amount = Money.of(input("Enter amount to withdraw in Ksh: "))
+    except ValueError:
+        return invalid_amount()
 
     if amount > balance:
         print("******************************")
@@ -30,8 +50,8 @@ def withdraw(balance):
     else:
         return amount
 
-def main():
-    balance = 0
+def main(folder=data_folder):
+    ledger = Ledger(folder, batch_size=1)
     is_running = True
 
     while is_running:
@@ -44,11 +64,15 @@ def main():
         choice = input("Enter your choice (1-4): ")
 
         if choice == "1":
-            show_balance(balance)
+            show_balance(ledger.balance)
         elif choice == "2":
-            balance += deposit()
+            amount = deposit()
+            if amount:
+                ledger.deposit(amount)
         elif choice == "3":
-            balance -= withdraw(balance)
+            amount = withdraw(ledger.balance)
+            if amount:
+                ledger.withdraw(amount)
         elif choice == "4":
             # break
             is_running = False
@@ -57,6 +81,7 @@ def main():
             print("You have entered an invalid choice")
             print("******************************")
 
+    ledger.close()
     print("******************************")
     print("Thank You Have A Nice Day")
     print("******************************")
@@ -0,0 +1,166 @@
+# Append-only transaction ledger for the banking program
+# Every deposit and withdrawal is added as one line to ledger.log:
+#   D 50000 1718000000.123456    (type, amount in cents, time)
+# Lines are written and fsync'ed in batches, and the balance is kept up to date
+# as each transaction is added. Every snapshot_every transactions the balance and
+# the log position are saved to snapshot.json, so opening the ledger only
+# replays the lines after the last snapshot, however long the history is.
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "money"))
+from money import Money
+
+DEPOSIT = "D"
+WITHDRAW = "W"
+
+
+# same rules as deposit() and withdraw() in banking_program_exercise.py
+def check_deposit(amount):
+    if amount < 0:
+        raise ValueError("That is an invalid amount")
+
+
+def check_withdraw(amount, balance):
+    if amount > balance:
+        raise ValueError("Insufficient amount")
+    elif amount < 0:
+        raise ValueError("Amount must be greater than 0 ")
+
+
+class Ledger:
+    def __init__(self, folder, batch_size=1_000, snapshot_every=100_000):
+        self.folder = folder
+        self.batch_size = batch_size
+        self.snapshot_every = snapshot_every
+        self.log_path = os.path.join(folder, "ledger.log")
+        self.snapshot_path = os.path.join(folder, "snapshot.json")
+        self.cents = 0
+        self.count = 0
+        self.offset = 0
+        self.pending = []
+        self.since_snapshot = 0
+
+        os.makedirs(folder, exist_ok=True)
+        self._recover()
+        self.file = open(self.log_path, "ab")
+
+    def _recover(self):
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path) as file:
+                snapshot = json.load(file)
+            self.cents = snapshot["cents"]
+            self.count = snapshot["count"]
+            self.offset = snapshot["offset"]
+
+        if not os.path.exists(self.log_path):
+            return
+
+        with open(self.log_path, "rb+") as file:
+            file.seek(self.offset)
+            for line in file:
+                # a line without "\n" was cut off by a crash, so it never happened
+                if not line.endswith(b"\n"):
+                    break
+                kind, amount, _ = line.split()
+                self._apply(kind.decode(), int(amount))
+                self.offset += len(line)
+                self.since_snapshot += 1
+            file.truncate(self.offset)
+
+    @property
+    def balance(self):
+        return Money(self.cents)
+
+    def _apply(self, kind, cents):
+        if kind == DEPOSIT:
+            self.cents += cents
+        else:
+            self.cents -= cents
+        self.count += 1
+
+    def _record(self, kind, amount):
+        self._apply(kind, amount.cents)
+        self.pending.append(f"{kind} {amount.cents} {time.time():.6f}\n".encode())
+        self.since_snapshot += 1
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def deposit(self, amount):
+        amount = Money.of(amount)
+        check_deposit(amount)
+        self._record(DEPOSIT, amount)
+        return self.balance
+
+    def withdraw(self, amount):
+        amount = Money.of(amount)
+        check_withdraw(amount, self.balance)
+        self._record(WITHDRAW, amount)
+        return self.balance
+
+    def _write_pending(self):
+        if self.pending:
+            data = b"".join(self.pending)
+            self.file.write(data)
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.offset += len(data)
+            self.pending = []
+
+    def flush(self):
+        self._write_pending()
+        if self.since_snapshot >= self.snapshot_every:
+            self.snapshot()
+
+    def snapshot(self):
+        # write to a temporary file and rename it, so a crash never leaves half a snapshot
+        self._write_pending()
+        temporary_path = self.snapshot_path + ".tmp"
+        with open(temporary_path, "w") as file:
+            json.dump({"cents": self.cents, "count": self.count, "offset": self.offset}, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+        self.since_snapshot = 0
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def main():
+    transactions = 200_000
+    with tempfile.TemporaryDirectory() as folder:
+        start = time.perf_counter()
+        with Ledger(folder) as ledger:
+            for i in range(transactions):
+                if i % 3 == 2:
+                    ledger.withdraw(50.0)
+                else:
+                    ledger.deposit(100.0)
+            balance = ledger.balance
+        seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with Ledger(folder) as ledger:
+            reopened = ledger.balance
+        reopen_seconds = time.perf_counter() - start
+
+    print("******************************")
+    print(f"{transactions / seconds:,.0f} transactions per second")
+    print(f"Balance Ksh.{balance:.2f} | after reopening Ksh.{reopened:.2f} in {reopen_seconds * 1000:.1f}ms")
+    print("******************************")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+# Statements and balance history over banking transactions
+# Transactions are kept as columns (NumPy arrays) sorted by time:
+#   times    - seconds since 1970
+#   amounts  - cents, + for a deposit and - for a withdrawal
+#   balances - running balance after each transaction (a prefix sum of amounts)
+# The balance at any time is then a binary search into balances, and monthly
+# totals are sums over slices, so nothing is replayed transaction by transaction.
+# Like the columns, everything statement() and monthly() return is in cents;
+# balance_at() gives Money for a single time.
+
+import os
+import time
+
+import numpy as np
+
+from ledger import DEPOSIT, Money
+
+
+class TransactionHistory:
+    def __init__(self, times, amounts):
+        times = np.asarray(times, dtype=np.float64)
+        amounts = np.asarray(amounts, dtype=np.int64)
+
+        # clocks can step backwards, so make sure the columns are in time order
+        if np.any(np.diff(times) < 0):
+            order = np.argsort(times, kind="stable")
+            times = times[order]
+            amounts = amounts[order]
+
+        self.times = times
+        self.amounts = amounts
+        self.balances = np.cumsum(amounts)
+
+    @classmethod
+    def from_ledger(cls, folder):
+        # ledger.log lines look like "D 50000 1718000000.123456"
+        with open(os.path.join(folder, "ledger.log"), "rb") as file:
+            columns = file.read().split()
+
+        kinds = np.array(columns[0::3])
+        amounts = np.array(columns[1::3]).astype(np.int64)
+        times = np.array(columns[2::3]).astype(np.float64)
+        amounts = np.where(kinds == DEPOSIT.encode(), amounts, -amounts)
+        return cls(times, amounts)
+
+    def __len__(self):
+        return len(self.times)
+
+    def balance_cents_at(self, when):
+        # works for one time or an array of times
+        if len(self) == 0:
+            return np.zeros(np.shape(when), dtype=np.int64)
+        index = np.searchsorted(self.times, when, side="right")
+        return np.where(index > 0, self.balances[index - 1], 0)
+
+    def balance_at(self, when):
+        # one time only, balance_cents_at() takes arrays
+        if np.ndim(when) != 0:
+            raise TypeError("balance_at() takes a single time, use balance_cents_at() for arrays")
+        return Money(int(self.balance_cents_at(when)))
+
+    def running_balances(self):
+        return self.balances
+
+    def statement(self, start, end):
+        # opening balance, every transaction in [start, end) and the closing balance
+        first = np.searchsorted(self.times, start, side="left")
+        last = np.searchsorted(self.times, end, side="left")
+        return {"opening": int(self.balances[first - 1]) if first > 0 else 0,
+                "times": self.times[first:last],
+                "amounts": self.amounts[first:last],
+                "balances": self.balances[first:last],
+                "closing": int(self.balances[last - 1]) if last > 0 else 0}
+
+    def monthly(self):
+        if len(self) == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return {"months": np.zeros(0, dtype=str), "deposits": empty, "withdrawals": empty,
+                    "count": empty, "closing": empty}
+
+        months = self.times.astype("datetime64[s]").astype("datetime64[M]")
+        # the times are sorted, so each month is one slice starting at starts[i]
+        labels, starts = np.unique(months, return_index=True)
+        ends = np.append(starts[1:], len(self))
+
+        deposits = np.add.reduceat(np.maximum(self.amounts, 0), starts)
+        withdrawals = -np.add.reduceat(np.minimum(self.amounts, 0), starts)
+
+        return {"months": labels.astype(str),
+                "deposits": deposits,
+                "withdrawals": withdrawals,
+                "count": ends - starts,
+                "closing": self.balances[ends - 1]}
+
+
+def main():
+    count = 5_000_000
+    rng = np.random.default_rng(7)
+    start_time = time.mktime((2022, 1, 1, 0, 0, 0, 0, 0, -1))
+    times = np.sort(start_time + rng.uniform(0, 3 * 365 * 24 * 3600, size=count))
+    amounts = rng.integers(-5_000, 10_000, size=count, dtype=np.int64)
+
+    started = time.perf_counter()
+    history = TransactionHistory(times, amounts)
+    build_time = time.perf_counter() - started
+
+    queries = rng.uniform(times[0], times[-1], size=10_000)
+    started = time.perf_counter()
+    history.balance_cents_at(queries)
+    query_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    months = history.monthly()
+    monthly_time = time.perf_counter() - started
+
+    print("******************************")
+    print(f"{count:,} transactions indexed in {build_time * 1000:.0f}ms")
+    print(f"10,000 balance-at-time queries in {query_time * 1000:.1f}ms")
+    print(f"{len(months['months'])} monthly totals in {monthly_time * 1000:.0f}ms")
+    print(f"{months['months'][0]}: deposits Ksh.{Money(months['deposits'][0]):.2f} | "
+          f"withdrawals Ksh.{Money(months['withdrawals'][0]):.2f} | closing Ksh.{Money(months['closing'][0]):.2f}")
+    print("******************************")
+
+
+if __name__ == "__main__":
+    main()
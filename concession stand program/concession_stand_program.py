@@ -1,16 +1,13 @@
 # Concession stand program
 
-menu = {"pizza": 3.00,
-        "nachos": 4.50,
-        "popcorn": 6.00,
-        "fries": 2.50,
-        "chips": 1.00,
-        "pretzel": 3.50,
-        "soda": 3.00,
-        "lemonade": 4.25,}
+from menu import Money, catalog
+
+# this order uses one version of the menu from start to finish
+snapshot = catalog.current()
+menu = snapshot.prices
 
 cart = []
-total = 0
+total = Money(0)
 
 print("-----------MENU-----------")
 for key, value in menu.items():
@@ -23,6 +20,9 @@ while True:
     if food == "q":
         break
 
+    # accepts aliases too, e.g. "pop" for soda
+    food = snapshot.lookup(food) or food
+
     if food not in menu.keys():
         if food == "q":
             break
@@ -38,7 +38,7 @@ if cart:
     print("--------YOUR ORDER--------")
     for food in cart:
         price = menu.get(food)
-        price += price
+        total += price
         print(f"{food:10} Ksh{price:.2f}")
 
     print(f"Total amount: {total:.2f}")
@@ -0,0 +1,10 @@
+# Concession stand menu, loaded from menu.json
+
+import os
+
+from menu_catalog import MenuCatalog, Money
+
+catalog = MenuCatalog(os.path.join(os.path.dirname(__file__), "menu.json"))
+
+# name -> price of the version loaded at start up
+menu = catalog.current().prices
@@ -0,0 +1,101 @@
+# Menu catalog loaded from menu.json that can be reloaded while the stand is open
+# Every load builds a new MenuSnapshot and swaps it in with one assignment
+# (copy-on-write). A snapshot is never changed after it is built, so an order
+# that took a snapshot keeps the same prices even if the file changes halfway.
+# Readers never take a lock. Only reloads share one, so two reloads can't race.
+
+import json
+import os
+import sys
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "money"))
+from money import Money
+
+
+def normalize(name):
+    # "  Pizza   Slice " -> "pizza slice"
+    return " ".join(name.lower().split())
+
+
+class MenuSnapshot:
+    def __init__(self, version, items):
+        self.version = version
+        # name -> price, in menu order, like the old hard-coded menu dict
+        self.prices = {}
+        # normalized name or alias -> name
+        self.index = {}
+
+        for item in items:
+            name = normalize(item["name"])
+            self.prices[name] = Money.of(item["price"])
+            for alias in [name] + item.get("aliases", []):
+                alias = normalize(alias)
+                if self.index.setdefault(alias, name) != name:
+                    raise ValueError(f"'{alias}' is used for both {self.index[alias]} and {name}")
+
+    def lookup(self, food):
+        # the menu name for food, or None when it is not on the menu
+        name = self.index.get(food)
+        if name is None:
+            name = self.index.get(normalize(food))
+        return name
+
+    def price(self, food):
+        name = self.lookup(food)
+        if name is None:
+            raise KeyError(f"{food} is not on the menu")
+        return self.prices[name]
+
+
+class MenuCatalog:
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.reload_lock = threading.Lock()
+        self.file_state = None
+        self.snapshot = None
+        self.watcher = None
+        self.reload()
+
+    def current(self):
+        return self.snapshot
+
+    def reload(self):
+        # returns True when a new version was swapped in
+        with self.reload_lock:
+            status = os.stat(self.file_path)
+            file_state = (status.st_mtime_ns, status.st_size)
+            if file_state == self.file_state:
+                return False
+
+            with open(self.file_path, encoding="utf-8") as file:
+                items = json.load(file)["items"]
+            version = self.snapshot.version + 1 if self.snapshot else 1
+            # a broken file raises here and the old snapshot stays in use
+            new_snapshot = MenuSnapshot(version, items)
+
+            self.snapshot = new_snapshot
+            self.file_state = file_state
+            return True
+
+    def _watch(self, interval, stop):
+        while not stop.wait(interval):
+            try:
+                self.reload()
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Menu not reloaded: {e}", file=sys.stderr)
+
+    def start_watching(self, interval=1.0):
+        # checks the file every interval seconds in a background thread
+        if self.watcher is None:
+            stop = threading.Event()
+            thread = threading.Thread(target=self._watch, args=(interval, stop), daemon=True)
+            self.watcher = (thread, stop)
+            thread.start()
+
+    def stop_watching(self):
+        if self.watcher is not None:
+            thread, stop = self.watcher
+            stop.set()
+            thread.join()
+            self.watcher = None
@@ -0,0 +1,172 @@
+# Batch order processing for the concession stand
+# Reads a point-of-sale export (CSV or JSONL) line by line:
+#   CSV:   order_id,item,quantity      (quantity is optional, header optional)
+#   JSONL: {"order_id": 1, "item": "pizza", "quantity": 2}
+# Each line is checked against the menu and added to its order, and when the
+# order id changes the finished order total is handed back. Lines of one order
+# are expected next to each other, as in a till export, so only the current
+# order is kept in memory however long the file is.
+#
+# python order_batch.py orders.csv    prints one total per order and a summary
+# python order_batch.py               runs a benchmark on a generated file
+
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from menu import Money, catalog, menu
+from menu_catalog import normalize
+
+
+class MenuIndex:
+    def __init__(self, snapshot):
+        # names are interned so matching item strings share one object
+        self.names = [sys.intern(name) for name in snapshot.prices]
+        positions = {name: i for i, name in enumerate(self.names)}
+        # every name and alias goes straight to the item number
+        self.index = {sys.intern(alias): positions[name] for alias, name in snapshot.index.items()}
+        self.prices = [price.cents for price in snapshot.prices.values()]
+
+    def lookup(self, item):
+        # None when the item is not on the menu
+        i = self.index.get(item)
+        if i is None:
+            i = self.index.get(normalize(item))
+        return i
+
+
+# readers yield (order_id, item, quantity), with item None for a line that
+# can't be read so it is counted as invalid instead of stopping the batch
+
+def read_csv(file):
+    for row in csv.reader(file):
+        if not row or row[0] == "order_id":
+            continue
+        if len(row) < 2:
+            yield row[0], None, 0
+            continue
+        yield row[0], row[1], row[2] if len(row) > 2 and row[2].strip() else 1
+
+
+def read_jsonl(file):
+    for line in file:
+        if not line.strip():
+            continue
+        try:
+            order = json.loads(line)
+            yield str(order["order_id"]), order["item"], order.get("quantity", 1)
+        except (ValueError, KeyError, TypeError):
+            yield None, None, 0
+
+
+class OrderBatch:
+    def __init__(self, menu_index):
+        self.menu_index = menu_index
+        self.orders = 0
+        self.lines = 0
+        self.invalid_lines = 0
+        self.grand_total_cents = 0
+        self.item_counts = [0] * len(menu_index.names)
+
+    @property
+    def grand_total(self):
+        return Money(self.grand_total_cents)
+
+    def process(self, rows):
+        # yields (order_id, order total) for every finished order
+        lookup = self.menu_index.lookup
+        prices = self.menu_index.prices
+        counts = self.item_counts
+        current = None
+        order_cents = 0
+
+        for order_id, item, quantity in rows:
+            self.lines += 1
+            i = lookup(item) if isinstance(item, str) else None
+            try:
+                quantity = int(quantity)
+            except (TypeError, ValueError):
+                quantity = 0
+            if i is None or quantity <= 0:
+                self.invalid_lines += 1
+                continue
+
+            if order_id != current:
+                if current is not None:
+                    yield self._finish(current, order_cents)
+                current = order_id
+                order_cents = 0
+
+            order_cents += prices[i] * quantity
+            counts[i] += quantity
+
+        if current is not None:
+            yield self._finish(current, order_cents)
+
+    def _finish(self, order_id, cents):
+        self.orders += 1
+        self.grand_total_cents += cents
+        return order_id, Money(cents)
+
+    def summary(self):
+        return {"orders": self.orders,
+                "lines": self.lines,
+                "invalid_lines": self.invalid_lines,
+                "grand_total": self.grand_total,
+                "item_counts": dict(zip(self.menu_index.names, self.item_counts))}
+
+
+def read_orders(file_path, file):
+    if file_path.endswith(".jsonl"):
+        return read_jsonl(file)
+    return read_csv(file)
+
+
+def process_file(file_path, output=None):
+    # the whole file is priced with one menu version, even if menu.json is reloaded meanwhile
+    batch = OrderBatch(MenuIndex(catalog.current()))
+    with open(file_path, newline="", encoding="utf-8") as file:
+        for order_id, order_total in batch.process(read_orders(file_path, file)):
+            if output is not None:
+                output.write(f"{order_id},{order_total:.2f}\n")
+    return batch.summary()
+
+
+def print_summary(summary):
+    print("--------------------------")
+    print(f"Orders: {summary['orders']:,} | lines: {summary['lines']:,} | invalid: {summary['invalid_lines']:,}")
+    for name, count in summary["item_counts"].items():
+        print(f"{name:10}: {count:,}")
+    print(f"Grand total: Ksh{summary['grand_total']:.2f}")
+    print("--------------------------")
+
+
+def main():
+    if len(sys.argv) > 1:
+        print_summary(process_file(sys.argv[1], sys.stdout))
+        return
+
+    lines = 1_000_000
+    items = list(menu) + ["burger"]  # burger is not on the menu
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = os.path.join(folder, "orders.csv")
+        with open(file_path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["order_id", "item", "quantity"])
+            for i in range(lines):
+                writer.writerow([i // 3, random.choice(items), random.randint(1, 3)])
+
+        start = time.perf_counter()
+        summary = process_file(file_path)
+        seconds = time.perf_counter() - start
+
+    print_summary(summary)
+    print(f"{lines:,} lines in {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,11 @@
-import time
+import asyncio
+
+from timer_service import TimerService
 
 my_time = int(input("Enter the time in seconds: "))
 
+# examples 1 - 4 also need: import time
+
 # example 1
 # for x in range(0, my_time):
 #     print(x)
@@ -21,10 +25,18 @@ my_time = int(input("Enter the time in seconds: "))
 # print("Time is up!")
 
 # example 4
-for x in range(my_time, 0, -1):
-    seconds = x % 60
-    minutes = int(x / 60) % 60
-    hours = int(x / 3600)
-    print(f"{hours:02}:{minutes:02}:{seconds:02}")
-    time.sleep(1)
-print("Time is up!")
\ No newline at end of file
+# for x in range(my_time, 0, -1):
+#     seconds = x % 60
+#     minutes = int(x / 60) % 60
+#     hours = int(x / 3600)
+#     print(f"{hours:02}:{minutes:02}:{seconds:02}")
+#     time.sleep(1)
+# print("Time is up!")
+
+# example 5 - ticks are due a whole number of seconds after the start, so they never drift
+async def main():
+    service = TimerService()
+    service.countdown(my_time, on_tick=print, on_done=lambda: print("Time is up!"))
+    await service.run()
+
+asyncio.run(main())
\ No newline at end of file
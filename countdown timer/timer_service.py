@@ -0,0 +1,202 @@
+# Many countdown timers on one asyncio loop
+# Time is split into ticks (10ms by default) counted from when the service starts.
+# Every timer is due on a tick number, worked out from the start time rather
+# than from the last tick, so printing or a slow callback never adds drift.
+#
+# Due timers are kept in a hierarchical timing wheel: 4 wheels of 256 slots.
+#   wheel 0 - one slot per tick for the next 256 ticks
+#   wheel 1 - one slot per 256 ticks, and so on
+# Adding or cancelling a timer is O(1). When wheel 0 goes round once, the
+# next slot of wheel 1 is spread out over wheel 0 (a "cascade").
+# The loop only wakes up when a slot has timers or a cascade is due, so
+# idle timers cost no CPU.
+
+import asyncio
+import math
+import time
+
+slot_bits = 8
+slots = 1 << slot_bits
+slot_mask = slots - 1
+levels = 4
+
+
+def format_time(x):
+    seconds = x % 60
+    minutes = int(x / 60) % 60
+    hours = int(x / 3600)
+    return f"{hours:02}:{minutes:02}:{seconds:02}"
+
+
+class TimingWheel:
+    def __init__(self):
+        self.wheels = [[[] for _ in range(slots)] for _ in range(levels)]
+        self.current = 0
+        self.count = 0
+
+    def _slot(self, entry):
+        tick = entry[0]
+        delta = tick - self.current
+        for level in range(levels):
+            if delta < 1 << (slot_bits * (level + 1)):
+                return self.wheels[level][(tick >> (slot_bits * level)) & slot_mask]
+        # further away than the last wheel reaches: park it in the last wheel's furthest slot
+        return self.wheels[-1][((self.current >> (slot_bits * (levels - 1))) - 1) & slot_mask]
+
+    def schedule(self, tick, callback):
+        # entry is [tick, callback, cancelled]
+        entry = [max(tick, self.current + 1), callback, False]
+        self._slot(entry).append(entry)
+        self.count += 1
+        return entry
+
+    def cancel(self, entry):
+        if not entry[2]:
+            entry[2] = True
+            self.count -= 1
+
+    def _cascade(self, level):
+        # move the timers of the next slot of this wheel down to the wheels below
+        index = (self.current >> (slot_bits * level)) & slot_mask
+        entries = self.wheels[level][index]
+        self.wheels[level][index] = []
+        for entry in entries:
+            if not entry[2]:
+                self._slot(entry).append(entry)
+
+    def advance(self, tick):
+        # run every timer due up to and including tick
+        while self.current < tick:
+            self.current += 1
+            for level in range(1, levels):
+                if self.current & ((1 << (slot_bits * level)) - 1):
+                    break
+                self._cascade(level)
+
+            index = self.current & slot_mask
+            entries = self.wheels[0][index]
+            if not entries:
+                continue
+            self.wheels[0][index] = []
+            for entry in entries:
+                if entry[2]:
+                    continue
+                if entry[0] > self.current:
+                    # parked too far away earlier, put it back in the right place
+                    self._slot(entry).append(entry)
+                    continue
+                entry[2] = True
+                self.count -= 1
+                entry[1]()
+
+    def next_tick(self):
+        # the next tick that needs a look: a non empty slot of wheel 0 or the next cascade
+        boundary = (self.current | slot_mask) + 1
+        for tick in range(self.current + 1, boundary):
+            if self.wheels[0][tick & slot_mask]:
+                return tick
+        return boundary
+
+
+class Countdown:
+    def __init__(self, service, seconds, on_tick, on_done):
+        self.service = service
+        self.seconds = seconds
+        self.on_tick = on_tick
+        self.on_done = on_done
+        self.start_tick = service.now_tick()
+        self.elapsed = 0
+        self.entry = None
+        self._tick()
+
+    def _tick(self):
+        remaining = self.seconds - self.elapsed
+        if remaining <= 0:
+            if self.on_done:
+                self.on_done()
+            return
+
+        self.on_tick(format_time(remaining))
+        self.elapsed += 1
+        # due exactly elapsed seconds after the start, however late this tick ran
+        tick = self.start_tick + round(self.elapsed / self.service.resolution)
+        self.entry = self.service.wheel.schedule(tick, self._tick)
+
+    def cancel(self):
+        if self.entry is not None:
+            self.service.wheel.cancel(self.entry)
+
+
+class TimerService:
+    def __init__(self, resolution=0.01):
+        self.resolution = resolution
+        self.wheel = TimingWheel()
+        self.start = time.monotonic()
+        self.wakeup = None
+
+    def now_tick(self):
+        return math.floor((time.monotonic() - self.start) / self.resolution)
+
+    def call_later(self, delay, callback):
+        tick = self.now_tick() + math.ceil(delay / self.resolution)
+        entry = self.wheel.schedule(tick, callback)
+        if self.wakeup is not None:
+            self.wakeup.set()
+        return entry
+
+    def cancel(self, entry):
+        self.wheel.cancel(entry)
+
+    def countdown(self, seconds, on_tick=print, on_done=None):
+        countdown = Countdown(self, seconds, on_tick, on_done)
+        if self.wakeup is not None:
+            self.wakeup.set()
+        return countdown
+
+    async def run(self):
+        # runs until no timers are left
+        self.wakeup = asyncio.Event()
+        while self.wheel.count:
+            self.wheel.advance(self.now_tick())
+            if not self.wheel.count:
+                break
+
+            deadline = self.start + self.wheel.next_tick() * self.resolution
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        self.wakeup = None
+
+
+async def benchmark(timers=10_000, seconds=3):
+    service = TimerService()
+    lateness = []
+    started = time.monotonic()
+
+    def on_tick(text):
+        pass
+
+    def on_done():
+        lateness.append(time.monotonic() - started - seconds)
+
+    for _ in range(timers):
+        service.countdown(seconds, on_tick, on_done)
+
+    cpu_start = time.process_time()
+    await service.run()
+    cpu = time.process_time() - cpu_start
+    return {"timers": timers, "cpu_seconds": cpu, "max_late": max(lateness)}
+
+
+def main():
+    results = asyncio.run(benchmark())
+    print(f"{results['timers']:,} countdowns of 3 seconds | CPU used: {results['cpu_seconds']:.3f}s | "
+          f"latest finish: {results['max_late'] * 1000:.1f}ms late")
+
+
+if __name__ == "__main__":
+    main()
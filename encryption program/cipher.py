@@ -0,0 +1,100 @@
+# Substitution cipher using translate tables
+# str.maketrans() builds the char -> key char mapping once, then
+# str.translate() changes a whole message in one call instead of a
+# chars.index() lookup and a string join for every letter.
+
+import random
+import string
+import time
+
+chars = " " + string.punctuation + string.digits + string.ascii_letters
+
+
+def random_key(alphabet=chars):
+    key = list(alphabet)
+    random.shuffle(key)
+    return "".join(key)
+
+
+class SubstitutionCipher:
+    def __init__(self, key, alphabet=chars, strict=False):
+        if sorted(key) != sorted(alphabet) or len(set(alphabet)) != len(alphabet):
+            raise ValueError("Key must use every character of the alphabet exactly once")
+
+        self.alphabet = alphabet
+        self.key = key
+        # strict=False leaves characters outside the alphabet (é, \n, ...) as they are
+        # strict=True refuses to encrypt them
+        self.strict = strict
+        self.allowed = frozenset(alphabet)
+        self.encrypt_table = str.maketrans(alphabet, key)
+        self.decrypt_table = str.maketrans(key, alphabet)
+
+        # byte tables for files, only possible when every character is one byte
+        # bytes >= 128 are never in the alphabet, so UTF-8 text passes through intact
+        if alphabet.isascii():
+            self.allowed_bytes = alphabet.encode("ascii")
+            self.encrypt_bytes_table = bytes.maketrans(self.allowed_bytes, key.encode("ascii"))
+            self.decrypt_bytes_table = bytes.maketrans(key.encode("ascii"), self.allowed_bytes)
+        else:
+            self.allowed_bytes = None
+
+    def check(self, text):
+        if self.strict:
+            unknown = set(text) - self.allowed
+            if unknown:
+                raise ValueError(f"Characters not in the alphabet: {''.join(sorted(unknown))!r}")
+
+    def check_bytes(self, data):
+        if self.allowed_bytes is None:
+            raise ValueError("Byte mode needs an ASCII alphabet")
+        # deleting every allowed byte leaves only the unknown ones
+        if self.strict and data.translate(None, self.allowed_bytes):
+            raise ValueError("Data contains bytes that are not in the alphabet")
+
+    def encrypt(self, plain_text):
+        self.check(plain_text)
+        return plain_text.translate(self.encrypt_table)
+
+    def decrypt(self, cipher_text):
+        self.check(cipher_text)
+        return cipher_text.translate(self.decrypt_table)
+
+    def encrypt_bytes(self, data):
+        self.check_bytes(data)
+        return data.translate(self.encrypt_bytes_table)
+
+    def decrypt_bytes(self, data):
+        self.check_bytes(data)
+        return data.translate(self.decrypt_bytes_table)
+
+
+def encrypt_with_index(plain_text, key, alphabet=chars):
+    # the old encryption_program.py loop, kept for comparison
+    cipher_text = ""
+    for letter in plain_text:
+        index = alphabet.index(letter)
+        cipher_text += "".join(key[index])
+    return cipher_text
+
+
+def main():
+    key = random_key()
+    cipher = SubstitutionCipher(key)
+    message = "".join(random.choices(chars, k=1_000_000))
+
+    start = time.perf_counter()
+    slow = encrypt_with_index(message, key)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = cipher.encrypt(message)
+    translate_time = time.perf_counter() - start
+
+    print(f"1MB message | loop: {loop_time:.3f}s | translate: {translate_time:.4f}s | "
+          f"{loop_time / translate_time:.0f}x faster | same result: {slow == fast}")
+    print(f"round trip ok: {cipher.decrypt(fast) == message}")
+
+
+if __name__ == "__main__":
+    main()
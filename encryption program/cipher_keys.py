@@ -0,0 +1,71 @@
+# Saving, loading and caching cipher keys
+# A key can come from a seed (same seed, same key) or from a key file,
+# so a message encrypted today can still be decrypted tomorrow.
+#
+# KeyRing keeps key files in a folder named by key id and remembers the
+# most recently used compiled ciphers, so a service with many tenants
+# builds each translate table once per key instead of once per message.
+
+import hashlib
+import json
+import os
+import random
+from functools import lru_cache
+
+from cipher import SubstitutionCipher, chars
+
+
+def key_from_seed(seed, alphabet=chars):
+    key = list(alphabet)
+    random.Random(seed).shuffle(key)
+    return "".join(key)
+
+
+def key_id(key, alphabet=chars):
+    return hashlib.sha256(f"{alphabet}\0{key}".encode("utf-8")).hexdigest()[:16]
+
+
+def save_key(file_path, key, alphabet=chars):
+    with open(file_path, "w", encoding="utf-8") as file:
+        json.dump({"id": key_id(key, alphabet), "alphabet": alphabet, "key": key}, file)
+
+
+def load_key(file_path):
+    with open(file_path, encoding="utf-8") as file:
+        data = json.load(file)
+
+    if key_id(data["key"], data["alphabet"]) != data["id"]:
+        raise ValueError(f"{file_path} is damaged: key does not match its id")
+    return data["key"], data["alphabet"]
+
+
+class KeyRing:
+    def __init__(self, folder, maxsize=128):
+        self.folder = folder
+        os.makedirs(folder, exist_ok=True)
+        # one cache per key ring, holding at most maxsize compiled ciphers
+        self.cipher = lru_cache(maxsize=maxsize)(self._compile)
+
+    def _path(self, key_id):
+        return os.path.join(self.folder, f"{key_id}.json")
+
+    def _compile(self, key_id):
+        key, alphabet = load_key(self._path(key_id))
+        return SubstitutionCipher(key, alphabet)
+
+    def add(self, key, alphabet=chars):
+        new_id = key_id(key, alphabet)
+        if not os.path.exists(self._path(new_id)):
+            save_key(self._path(new_id), key, alphabet)
+        return new_id
+
+    def remove(self, key_id):
+        os.remove(self._path(key_id))
+        # the cache can't drop a single entry, so start it again
+        self.cipher.cache_clear()
+
+    def encrypt(self, key_id, plain_text):
+        return self.cipher(key_id).encrypt(plain_text)
+
+    def decrypt(self, key_id, cipher_text):
+        return self.cipher(key_id).decrypt(cipher_text)
@@ -1,33 +1,31 @@
-import random
-import string
+import os
 
-chars = " " + string.punctuation + string.digits + string.ascii_letters
-chars = list(chars)
-key = chars.copy()
+from cipher import SubstitutionCipher, chars, random_key
+from cipher_keys import load_key, save_key
 
-random.shuffle(key)
+# the key is kept in key.json, so messages can be decrypted on the next run too
+key_path = os.path.join(os.path.dirname(__file__), "key.json")
 
-print(f"chars: {chars}")
-print(f"key: {key}")
+if os.path.exists(key_path):
+    key, alphabet = load_key(key_path)
+else:
+    key, alphabet = random_key(), chars
+    save_key(key_path, key, alphabet)
+
+cipher = SubstitutionCipher(key, alphabet)
+
+print(f"chars: {list(alphabet)}")
+print(f"key: {list(key)}")
 
 #encryption
 plain_text = input("Enter a  message to encrypt: ")
-cipher_text = ""
-
-for letter in plain_text:
-    index = chars.index(letter)
-    cipher_text += "".join(key[index])
-    # cipher_text += key[index]
+cipher_text = cipher.encrypt(plain_text)
 print(f"original message: {plain_text}")
 print(f"encrypted message: {cipher_text}")
 
 
 #dencryption
 cipher_text = input("Enter a  message to dencrypt: ")
-plain_text = ""
-
-for letter in cipher_text:
-    index = key.index(letter)
-    plain_text += chars[index]
+plain_text = cipher.decrypt(cipher_text)
 print(f"encrypted message: {cipher_text}")
 print(f"original message: {plain_text}")
\ No newline at end of file
@@ -0,0 +1,83 @@
+# Streaming file encryption with the substitution cipher
+# Files are read in fixed size chunks and run through bytes.translate(),
+# so memory use is a few chunks whatever the file size.
+# With workers set, chunks are sent to a process pool and written back in order.
+
+import os
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from cipher import SubstitutionCipher, chars, random_key
+
+chunk_size = 1 << 20  # 1MB
+
+
+def read_chunks(file, size=chunk_size):
+    while True:
+        chunk = file.read(size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def translate_chunk(chunk, table):
+    return chunk.translate(table)
+
+
+def translate_file(cipher, table, source_path, destination_path, size=chunk_size, workers=None):
+    with open(source_path, "rb") as source, open(destination_path, "wb") as destination:
+        if not workers:
+            for chunk in read_chunks(source, size):
+                cipher.check_bytes(chunk)
+                destination.write(chunk.translate(table))
+            return
+
+        # never more than two chunks per worker waiting, so memory stays bounded
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            for chunk in read_chunks(source, size):
+                cipher.check_bytes(chunk)
+                pending.append(pool.submit(translate_chunk, chunk, table))
+                if len(pending) >= workers * 2:
+                    destination.write(pending.popleft().result())
+            while pending:
+                destination.write(pending.popleft().result())
+
+
+def encrypt_file(cipher, source_path, destination_path, size=chunk_size, workers=None):
+    translate_file(cipher, cipher.encrypt_bytes_table, source_path, destination_path, size, workers)
+
+
+def decrypt_file(cipher, source_path, destination_path, size=chunk_size, workers=None):
+    translate_file(cipher, cipher.decrypt_bytes_table, source_path, destination_path, size, workers)
+
+
+def main():
+    cipher = SubstitutionCipher(random_key())
+    megabytes = 64
+
+    with tempfile.TemporaryDirectory() as folder:
+        plain_path = os.path.join(folder, "app.log")
+        cipher_path = os.path.join(folder, "app.log.enc")
+        round_trip_path = os.path.join(folder, "app.log.dec")
+
+        line = ("2024-01-01 12:00:00 INFO user=42 action=login status=ok " + chars + "\n").encode()
+        with open(plain_path, "wb") as file:
+            for _ in range(megabytes * (1 << 20) // len(line)):
+                file.write(line)
+
+        for workers in (None, os.cpu_count()):
+            start = time.perf_counter()
+            encrypt_file(cipher, plain_path, cipher_path, workers=workers)
+            seconds = time.perf_counter() - start
+            decrypt_file(cipher, cipher_path, round_trip_path, workers=workers)
+
+            with open(plain_path, "rb") as plain, open(round_trip_path, "rb") as round_trip:
+                same = plain.read() == round_trip.read()
+            print(f"workers: {workers or 0} | {megabytes / seconds:.0f}MB/s | round trip ok: {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
-import random
+import sys
 
 from wordslist import words
+from word_index import WordIndex
+from word_source import FileWordSource, ListWordSource
+
+index = WordIndex(words)
 
 # dictionary of key:()
 hangman_art = {0: ("   ",
@@ -40,8 +44,8 @@ def display_hint(hint):
 def display_answer(answer):
     print(" ".join(answer))
 
-def main():
-    answer = random.choice(words)
+def main(source=ListWordSource(index.words)):
+    answer = source.choice()
     hint = ["_"] * len(answer)
     wrong_guesses = 0
     guessed_letters = set()
@@ -62,11 +66,7 @@ def main():
 
         guessed_letters.add(guess)
 
-        if guess in answer:
-            for i in range(len(answer)):
-                if answer[i] == guess:
-                    hint[i] = guess
-        else:
+        if not index.reveal(hint, answer, guess):
             wrong_guesses += 1
 
         if "_" not in hint:
@@ -81,7 +81,12 @@ def main():
             is_running = False
 
 if __name__ == '__main__':
-    main()
+    # python hangman_program.py dictionary.txt plays words from a file instead
+    if len(sys.argv) > 1:
+        with FileWordSource(sys.argv[1]) as source:
+            main(source)
+    else:
+        main()
 
 
 
@@ -0,0 +1,76 @@
+# Automatic hangman player and benchmark over the whole wordlist
+# Candidates are filtered with bitset intersections from word_index,
+# then the next guess is the letter found in the most remaining candidates.
+
+import string
+import time
+
+from hangman_program import hangman_art, index
+
+max_wrong_guesses = len(hangman_art) - 1
+
+
+def best_guess(hint, guessed_letters):
+    candidates = index.matching(hint, guessed_letters)
+    length = len(hint)
+    best_letter = None
+    best_count = -1
+
+    for letter in string.ascii_lowercase:
+        if letter in guessed_letters:
+            continue
+        count = (candidates & index.candidates(length, letter)).bit_count()
+        if count > best_count:
+            best_letter = letter
+            best_count = count
+    return best_letter
+
+
+def play(answer):
+    # same rules as main(): win when the hint is full, lose on the last drawing
+    hint = ["_"] * len(answer)
+    guessed_letters = set()
+    wrong_guesses = 0
+
+    while True:
+        guess = best_guess(hint, guessed_letters)
+        guessed_letters.add(guess)
+
+        if not index.reveal(hint, answer, guess):
+            wrong_guesses += 1
+
+        if "_" not in hint:
+            return True, len(guessed_letters)
+        elif wrong_guesses >= max_wrong_guesses:
+            return False, len(guessed_letters)
+
+
+def benchmark(words=index.words):
+    start = time.perf_counter()
+    wins = 0
+    guesses = 0
+
+    for word in words:
+        won, count = play(word)
+        wins += won
+        guesses += count
+
+    return {"words": len(words),
+            "win_rate": wins / len(words),
+            "guesses_per_word": guesses / len(words),
+            "seconds": time.perf_counter() - start}
+
+
+def main():
+    results = benchmark()
+
+    print("*****************")
+    print(f"Words played:     {results['words']}")
+    print(f"Win rate:         {results['win_rate']:.1%}")
+    print(f"Guesses per word: {results['guesses_per_word']:.2f}")
+    print(f"Time:             {results['seconds']:.3f}s")
+    print("*****************")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+# Letter position index for the hangman wordlist
+# Built once at load time:
+#   words       - every word once, lower case, in the order first seen
+#   masks       - word -> {letter: bitmask of the positions it appears at}
+#   by_length   - length -> bitset of word ids
+#   with_letter - (length, letter) -> bitset of word ids containing the letter
+#   with_mask   - (length, letter, mask) -> bitset of word ids with the letter
+#                 at exactly those positions
+#
+# A bitset is a plain int where bit i is set when word i is a candidate,
+# so a set of thousands of words is a few hundred bytes.
+
+def to_bitset(ids):
+    bits = bytearray(max(ids, default=0) // 8 + 1)
+    for i in ids:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, "little")
+
+
+def from_bitset(bitset):
+    ids = []
+    while bitset:
+        low = bitset & -bitset
+        ids.append(low.bit_length() - 1)
+        bitset ^= low
+    return ids
+
+
+def letter_masks(word):
+    masks = {}
+    for position, letter in enumerate(word):
+        masks[letter] = masks.get(letter, 0) | (1 << position)
+    return masks
+
+
+class WordIndex:
+    def __init__(self, words):
+        # dict keeps the first time each word is seen and drops duplicates
+        # words with digits ("K2") can never be guessed, so they are left out
+        unique = dict.fromkeys(word.lower() for word in words if word.isalpha())
+        self.words = tuple(unique)
+        self.masks = {}
+
+        lengths = {}
+        letters = {}
+        patterns = {}
+        for i, word in enumerate(self.words):
+            masks = letter_masks(word)
+            self.masks[word] = masks
+
+            lengths.setdefault(len(word), []).append(i)
+            for letter, mask in masks.items():
+                letters.setdefault((len(word), letter), []).append(i)
+                patterns.setdefault((len(word), letter, mask), []).append(i)
+
+        self.by_length = {length: to_bitset(ids) for length, ids in lengths.items()}
+        self.with_letter = {key: to_bitset(ids) for key, ids in letters.items()}
+        self.with_mask = {key: to_bitset(ids) for key, ids in patterns.items()}
+
+    def __len__(self):
+        return len(self.words)
+
+    def positions(self, word, letter):
+        # 0 when the letter is not in the word
+        # words from a dictionary file are not in the index, so work them out
+        masks = self.masks.get(word)
+        if masks is None:
+            masks = letter_masks(word)
+        return masks.get(letter, 0)
+
+    def reveal(self, hint, word, letter):
+        # fills in the hint and returns True when the letter is in the word
+        mask = self.positions(word, letter)
+        found = mask != 0
+        while mask:
+            low = mask & -mask
+            hint[low.bit_length() - 1] = letter
+            mask ^= low
+        return found
+
+    def candidates(self, length, letter=None):
+        if letter is None:
+            return self.by_length.get(length, 0)
+        return self.with_letter.get((length, letter), 0)
+
+    def matching(self, hint, guessed_letters):
+        # words that fit the hint, e.g. ['_', 'e', '_', '_'], and none of the missed letters
+        length = len(hint)
+        bitset = self.candidates(length)
+        for letter in guessed_letters:
+            mask = 0
+            for position, shown in enumerate(hint):
+                if shown == letter:
+                    mask |= 1 << position
+            if mask:
+                bitset &= self.with_mask.get((length, letter, mask), 0)
+            else:
+                bitset &= ~self.candidates(length, letter)
+        return bitset
+
+    def lookup(self, bitset):
+        return [self.words[i] for i in from_bitset(bitset)]
@@ -0,0 +1,82 @@
+# Word sources for hangman
+# ListWordSource picks from a Python list like random.choice(words).
+# FileWordSource memory maps a newline separated dictionary file, so a file
+# with hundreds of thousands of words costs no startup time and no list.
+#
+# Picking a word from the file:
+#   1. pick a random byte and find the line it falls on
+#   2. longer lines are hit more often, so only keep the line with
+#      probability 2 / (line length + newline)
+# Every word ends up with the same chance, just like random.choice().
+
+import mmap
+import random
+
+max_attempts = 100_000
+
+
+class ListWordSource:
+    def __init__(self, words):
+        self.words = words
+
+    def choice(self):
+        return random.choice(self.words)
+
+    def __iter__(self):
+        return iter(self.words)
+
+
+class FileWordSource:
+    def __init__(self, file_path):
+        self.file = open(file_path, "rb")
+        try:
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ValueError(f"{file_path} is empty")
+
+        # a last line without "\n" gets a pretend one so it is not picked less often
+        self.size = len(self.data)
+        self.end = self.size if self.data[-1:] == b"\n" else self.size + 1
+
+    def _line(self, start, end):
+        return self.data[start:end].strip().decode("utf-8").lower()
+
+    def choice(self):
+        for _ in range(max_attempts):
+            offset = random.randrange(self.end)
+            start = self.data.rfind(b"\n", 0, offset) + 1
+            end = self.data.find(b"\n", offset)
+            if end == -1:
+                end = self.size
+
+            if random.random() * (end - start + 1) >= 2:
+                continue
+
+            word = self._line(start, end)
+            # blank lines and words like "K2" can't be played
+            if word.isalpha():
+                return word
+
+        raise ValueError("No playable words found in the dictionary file")
+
+    def __iter__(self):
+        start = 0
+        while start < self.size:
+            end = self.data.find(b"\n", start)
+            if end == -1:
+                end = self.size
+            word = self._line(start, end)
+            if word.isalpha():
+                yield word
+            start = end + 1
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
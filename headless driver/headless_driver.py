@@ -0,0 +1,194 @@
+# Runs the input() based programs without a person at the keyboard
+# A session is a list of answers fed to input() one by one. Everything the
+# program prints goes into a buffer, and time.sleep() only moves a pretend
+# clock forward, so a session that takes a person minutes runs in microseconds.
+#
+# Recorded sessions (program, seed, inputs, output) can be replayed to check
+# that a program still prints exactly the same thing. sessions.jsonl holds a
+# recording of example_sessions; record it again only when an output change
+# is meant to happen.
+
+import builtins
+import contextlib
+import difflib
+import importlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from functools import lru_cache
+
+repo_folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# the recorded sessions checked in next to this file
+sessions_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sessions.jsonl")
+
+
+class ScriptedInput:
+    def __init__(self, inputs, output):
+        self.inputs = iter(inputs)
+        self.output = output
+
+    def __call__(self, prompt=""):
+        self.output.write(str(prompt))
+        try:
+            return next(self.inputs)
+        except StopIteration:
+            raise EOFError("No more scripted input") from None
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def add_to_path(folder):
+    folder = os.path.join(repo_folder, folder)
+    if folder not in sys.path:
+        sys.path.insert(0, folder)
+    return folder
+
+
+@lru_cache(maxsize=None)
+def compile_script(folder, file_name):
+    # scripts run all their code at the top level, so they are compiled once and exec'ed per session
+    path = os.path.join(add_to_path(folder), file_name)
+    with open(path, encoding="utf-8") as file:
+        return compile(file.read(), path, "exec"), path
+
+
+def load_main(folder, module_name):
+    # programs with a main() are imported once and main() is called per session
+    add_to_path(folder)
+    return importlib.import_module(module_name).main
+
+
+def script(folder, file_name):
+    def play():
+        code, path = compile_script(folder, file_name)
+        exec(code, {"__name__": "__main__", "__file__": path})
+    return play
+
+
+def banking():
+    main = load_main("banking program", "banking_program_exercise")
+    # every session starts with an empty ledger of its own
+    with tempfile.TemporaryDirectory() as folder:
+        main(folder)
+
+
+programs = {"banking": banking,
+            "slot_machine": lambda: load_main("slot machine", "slot_machine")(),
+            "hangman": lambda: load_main("hangman program", "hangman_program")(),
+            "quiz_game": script("quiz game", "quiz_game.py"),
+            "number_guessing_game": script("random numbers", "number_guessing_game.py"),
+            "rock_paper_scissors": script("rock paper scissors", "rock_paper_scissors.py")}
+
+
+def run(program, inputs, seed=None):
+    output = io.StringIO()
+    clock = VirtualClock()
+    real_input, real_sleep = builtins.input, time.sleep
+    builtins.input = ScriptedInput(inputs, output)
+    time.sleep = clock.sleep
+    random.seed(seed)
+    error = None
+
+    try:
+        with contextlib.redirect_stdout(output):
+            programs[program]()
+    except EOFError:
+        error = "ran out of input"
+    except Exception as e:
+        error = repr(e)
+    finally:
+        builtins.input, time.sleep = real_input, real_sleep
+
+    return {"output": output.getvalue(), "seconds": clock.now, "error": error}
+
+
+def record(sessions):
+    # sessions: [{"program": ..., "seed": ..., "inputs": [...]}, ...]
+    recorded = []
+    for session in sessions:
+        result = run(session["program"], session["inputs"], session.get("seed"))
+        recorded.append({**session, "output": result["output"], "error": result["error"]})
+    return recorded
+
+
+def replay(sessions):
+    # returns (session, new result) for every session whose output no longer matches the recording
+    changed = []
+    for session in sessions:
+        result = run(session["program"], session["inputs"], session.get("seed"))
+        if result["output"] != session["output"] or result["error"] != session["error"]:
+            changed.append((session, result))
+    return changed
+
+
+def describe_change(session, result, context=2):
+    lines = [f"{session['program']} (seed {session.get('seed')}, inputs {session['inputs']})"]
+    if result["error"] != session["error"]:
+        lines.append(f"  error: {session['error']!r} -> {result['error']!r}")
+    diff = difflib.unified_diff(session["output"].splitlines(), result["output"].splitlines(),
+                                "recorded", "now", n=context, lineterm="")
+    lines.extend("  " + line for line in diff)
+    return "\n".join(lines)
+
+
+def save_sessions(file_path, sessions):
+    with open(file_path, "w", encoding="utf-8") as file:
+        for session in sessions:
+            file.write(json.dumps(session, ensure_ascii=False) + "\n")
+
+
+def load_sessions(file_path):
+    with open(file_path, encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+example_sessions = [
+    {"program": "banking", "seed": 1, "inputs": ["2", "500", "3", "120.50", "1", "3", "9000", "5", "4"]},
+    {"program": "slot_machine", "seed": 2, "inputs": ["10", "y", "abc", "20", "y", "5", "n"]},
+    {"program": "hangman", "seed": 3, "inputs": list("etaoinshrdlucmfwyp")},
+    {"program": "quiz_game", "seed": 4, "inputs": ["C", "x", "D", "B", "A", "B"]},
+    {"program": "number_guessing_game", "seed": 5, "inputs": [str(n) for n in range(1, 11)]},
+    {"program": "rock_paper_scissors", "seed": 6, "inputs": ["rock", "paper", "lizard", "scissors", "q"]},
+]
+
+
+def main():
+    # python headless_driver.py                  replays sessions.jsonl
+    # python headless_driver.py --replay FILE    replays another recording
+    # python headless_driver.py --record         records example_sessions into sessions.jsonl again
+    args = sys.argv[1:]
+    if args[:1] == ["--record"]:
+        save_sessions(sessions_path, record(example_sessions))
+        print(f"Recorded {len(example_sessions)} sessions into {sessions_path}")
+        return
+
+    sessions = load_sessions(args[1] if args[:1] == ["--replay"] else sessions_path)
+    changed = replay(sessions)
+    for session, result in changed:
+        print(describe_change(session, result))
+    print(f"Sessions with different output: {len(changed)} of {len(sessions)}")
+    if changed:
+        sys.exit(1)
+
+    rounds = 500
+    start = time.perf_counter()
+    for _ in range(rounds):
+        replay(sessions)
+    seconds = time.perf_counter() - start
+
+    played = rounds * len(sessions)
+    print(f"Replayed {played:,} sessions in {seconds:.2f}s ({played / seconds:,.0f} sessions per second)")
+
+
+if __name__ == "__main__":
+    main()
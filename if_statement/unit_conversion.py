@@ -0,0 +1,120 @@
+# Unit conversions for whole columns of numbers
+# Every unit is written as a straight line from its quantity's base unit:
+#   base = value * scale + offset
+# so converting between any two units of the same quantity is also a straight
+# line. Those (scale, offset) pairs are worked out once for every pair of units,
+# and converting a NumPy array is one multiply and one add.
+#
+# Weight uses 2.205 pounds to the kilogram like weight_converter.py.
+
+import csv
+import itertools
+import os
+import tempfile
+import time
+
+import numpy as np
+
+# unit: (quantity, scale, offset, label)
+units = {"C": ("temperature", 1.0, 0.0, "°C"),
+         "F": ("temperature", 5 / 9, -32 * 5 / 9, "°F"),
+         "K": ("temperature", 1.0, -273.15, "K"),
+         "kg": ("weight", 1.0, 0.0, "Kgs."),
+         "g": ("weight", 0.001, 0.0, "g"),
+         "lb": ("weight", 1 / 2.205, 0.0, "Lbs.")}
+
+
+def build_coefficients(units):
+    # (source, target): (scale, offset) for every pair of units of the same quantity
+    coefficients = {}
+    for source, target in itertools.product(units, repeat=2):
+        quantity, source_scale, source_offset, _ = units[source]
+        target_quantity, target_scale, target_offset, _ = units[target]
+        if quantity == target_quantity:
+            coefficients[source, target] = (source_scale / target_scale,
+                                            (source_offset - target_offset) / target_scale)
+    return coefficients
+
+
+coefficients = build_coefficients(units)
+
+
+def register(unit, quantity, scale, offset=0.0, label=None):
+    # e.g. register("oz", "weight", 0.0283495) adds ounces to every weight conversion
+    units[unit] = (quantity, scale, offset, label or unit)
+    coefficients.clear()
+    coefficients.update(build_coefficients(units))
+
+
+def coefficient(source, target):
+    try:
+        return coefficients[source, target]
+    except KeyError:
+        raise ValueError(f"Can't convert {source} to {target}") from None
+
+
+def label(unit):
+    return units[unit][3]
+
+
+def convert(values, source, target):
+    scale, offset = coefficient(source, target)
+    return np.asarray(values, dtype=np.float64) * scale + offset
+
+
+def convert_csv(input_path, output_path, column, source, target, decimals=2, chunk_rows=100_000):
+    # adds a "<column> (<target>)" column, reading chunk_rows rows at a time so memory stays small
+    scale, offset = coefficient(source, target)
+    rows_done = 0
+
+    with open(input_path, newline="", encoding="utf-8") as input_file, \
+            open(output_path, "w", newline="", encoding="utf-8") as output_file:
+        reader = csv.reader(input_file)
+        writer = csv.writer(output_file)
+        header = next(reader)
+        index = header.index(column)
+        writer.writerow(header + [f"{column} ({target})"])
+
+        while True:
+            rows = list(itertools.islice(reader, chunk_rows))
+            if not rows:
+                break
+            try:
+                values = np.array([row[index] for row in rows], dtype=np.float64)
+            except ValueError:
+                raise ValueError(f"{column} has a value that isn't a number near row {rows_done + 2}") from None
+            converted = values * scale + offset
+            writer.writerows(row + [f"{value:.{decimals}f}"] for row, value in zip(rows, converted))
+            rows_done += len(rows)
+
+    return rows_done
+
+
+def main():
+    rng = np.random.default_rng(1)
+    temperatures = rng.uniform(-40, 50, size=10_000_000)
+
+    start = time.perf_counter()
+    fahrenheit = convert(temperatures, "C", "F")
+    seconds = time.perf_counter() - start
+    print(f"{len(temperatures):,} temperatures C -> F in {seconds * 1000:.0f}ms")
+    print(f"100{label('C')} = {convert(100, 'C', 'F'):.1f}{label('F')} | "
+          f"{fahrenheit[0]:.1f}{label('F')} = {convert(fahrenheit[0], 'F', 'K'):.2f}{label('K')}")
+
+    rows = 1_000_000
+    with tempfile.TemporaryDirectory() as folder:
+        input_path = os.path.join(folder, "weights.csv")
+        output_path = os.path.join(folder, "weights_lb.csv")
+        with open(input_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(["id", "weight"])
+            writer.writerows(zip(range(rows), np.round(rng.uniform(40, 120, size=rows), 1).tolist()))
+
+        start = time.perf_counter()
+        convert_csv(input_path, output_path, "weight", "kg", "lb", decimals=1)
+        seconds = time.perf_counter() - start
+        print(f"{rows:,} CSV rows kg -> lb in {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
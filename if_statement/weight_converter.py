@@ -1,13 +1,15 @@
+from unit_conversion import convert, label
+
 weight = float(input("Enter your weight: "))
 unit = input("Kilograms or Pounds? (K or P): ").upper()
 
 if unit == "K":
-    weight = weight * 2.205
-    unit = "Lbs."
+    weight = float(convert(weight, "kg", "lb"))
+    unit = label("lb")
     print(f"Your weight is {round(weight, 1)} {unit}")
 elif unit == "P":
-    weight = weight / 2.205
-    unit = "Kgs."
+    weight = float(convert(weight, "lb", "kg"))
+    unit = label("kg")
     print(f"Your weight is {round(weight, 1)} {unit}")
 else:
     print(f"{unit} was not a valid")
@@ -0,0 +1,146 @@
+# Exact money amounts stored as whole cents
+# 0.1 + 0.2 is 0.30000000000000004 with floats, but 10 + 20 cents is always 30.
+# Money formats like a float, so f"Ksh{price:.2f}" keeps working unchanged.
+#
+# Big batches of amounts live in NumPy int64 arrays of cents (8 bytes each)
+# and are totalled in one call, which is exact and much faster than Decimal.
+#
+# Other folders import it with:
+#   sys.path.append(os.path.join(os.path.dirname(__file__), "..", "money"))
+#   from money import Money
+
+import time
+from decimal import Decimal
+
+import numpy as np
+
+
+class Money:
+    __slots__ = ("cents",)
+
+    def __init__(self, cents=0):
+        self.cents = int(cents)
+
+    @classmethod
+    def of(cls, value):
+        # Money.of("4.25"), Money.of(4.25) and Money.of(4) are all in Ksh, not cents
+        if isinstance(value, Money):
+            return value
+        if isinstance(value, str):
+            return cls(parse_cents(value))
+        if isinstance(value, int):
+            return cls(value * 100)
+        return cls(round(value * 100))
+
+    def __add__(self, other):
+        return Money(self.cents + Money.of(other).cents)
+
+    def __radd__(self, other):
+        # lets sum() start from 0
+        return self + other
+
+    def __sub__(self, other):
+        return Money(self.cents - Money.of(other).cents)
+
+    def __rsub__(self, other):
+        return Money.of(other) - self
+
+    def __mul__(self, quantity):
+        return Money(round(self.cents * quantity))
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return Money(-self.cents)
+
+    def __eq__(self, other):
+        # only equal to other Money, so equal values always have equal hashes
+        # (Money.of(1) == 1 would need hash(Money.of(1)) == hash(1))
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.cents == other.cents
+
+    def __lt__(self, other):
+        return self.cents < Money.of(other).cents
+
+    def __le__(self, other):
+        return self.cents <= Money.of(other).cents
+
+    def __gt__(self, other):
+        return self.cents > Money.of(other).cents
+
+    def __ge__(self, other):
+        return self.cents >= Money.of(other).cents
+
+    def __hash__(self):
+        return hash(self.cents)
+
+    def __bool__(self):
+        return self.cents != 0
+
+    def __float__(self):
+        return self.cents / 100
+
+    def __format__(self, spec):
+        # Decimal takes the same format specs as a float ("10.2f", ",.2f", ...)
+        # but formats the cents exactly
+        if not spec:
+            return str(self)
+        return format(Decimal(self.cents).scaleb(-2), spec)
+
+    def __str__(self):
+        return f"Ksh{self:.2f}"
+
+    def __repr__(self):
+        return f"Money.of('{self:.2f}')"
+
+
+def parse_cents(text):
+    # "12.5" -> 1250 without going through a float
+    number = text.strip()
+    sign = -1 if number[:1] == "-" else 1
+    if number[:1] in ("-", "+"):
+        number = number[1:]
+    whole, _, fraction = number.partition(".")
+    if not (whole or fraction) or not (whole + fraction).isdigit() or len(fraction) > 2:
+        raise ValueError(f"{text!r} is not an amount of money")
+    return sign * (int(whole or "0") * 100 + int(fraction.ljust(2, "0")))
+
+
+def cents_array(values):
+    # a list of amounts in Ksh (strings, ints, floats or Money) -> int64 array of cents
+    return np.fromiter((Money.of(value).cents for value in values), dtype=np.int64)
+
+
+def total(cents):
+    # cents is an int64 array, e.g. from cents_array()
+    return Money(np.asarray(cents, dtype=np.int64).sum())
+
+
+def main():
+    count = 1_000_000
+    rng = np.random.default_rng(1)
+    amounts = rng.integers(1, 1_000_000, size=count, dtype=np.int64)  # up to Ksh 9,999.99
+
+    floats = (amounts / 100).tolist()
+    decimals = [Decimal(int(cents)).scaleb(-2) for cents in amounts]
+
+    start = time.perf_counter()
+    float_total = sum(floats)
+    float_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decimal_total = sum(decimals)
+    decimal_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    money_total = total(amounts)
+    money_time = time.perf_counter() - start
+
+    print(f"float:   Ksh{float_total:.6f} in {float_time * 1000:.1f}ms")
+    print(f"Decimal: Ksh{decimal_total} in {decimal_time * 1000:.1f}ms")
+    print(f"Money:   {money_total} in {money_time * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
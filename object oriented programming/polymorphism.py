@@ -7,39 +7,54 @@
 # 2. "Duck Typing" - Object must have necessary attributes/methods
 
 
-class Shape:
+# The shapes keep their dimensions in a ShapeCollection (NumPy arrays), and
+# each class still overrides area() in its own way
+import math
+
+from shape_collection import ShapeCollection
+from shape_collection import Shape as ShapeView
+
+
+class Shape(ShapeView):
     def area(self):
         pass
 
 class Circle(Shape):
-    def __init__(self, radius):
-        self.radius = radius
+    kind = "circle"
+
+    def __init__(self, collection, radius):
+        super().__init__(collection, radius=radius)
 
     def area(self):
-        return 3.14 * self.radius ** 2
+        return math.pi * self._get("radius") ** 2
 
 class Square(Shape):
-    def __init__(self, side):
-        self.radius = side
+    kind = "square"
+
+    def __init__(self, collection, side):
+        super().__init__(collection, side=side)
 
     def area(self):
-        return self.radius ** 2
+        return self._get("side") ** 2
 
 class Triangle(Shape):
-    def __init__(self, base, height):
-        self.base = base
-        self.height = height
+    kind = "triangle"
+
+    def __init__(self, collection, base, height):
+        super().__init__(collection, base=base, height=height)
 
     def area(self):
-        return self.base * self.height
+        return 0.5 * self._get("base") * self._get("height")
 
 class Pizza(Circle):
-    def __init__(self, topping, radius):
-        super().__init__(radius)
-        # Circle.__init__(self, radius)
-        self.topping = topping
+    kind = "pizza"
+
+    def __init__(self, collection, topping, radius):
+        # Circle.__init__ only knows about radius, a pizza row also has a topping
+        Shape.__init__(self, collection, topping=topping, radius=radius)
 
-shapes = [Circle(4), Square(5), Triangle(6,7), Pizza("BBQ", 15)]
+collection = ShapeCollection()
+shapes = [Circle(collection, 4), Square(collection, 5), Triangle(collection, 6, 7), Pizza(collection, "BBQ", 15)]
 
 for shape in shapes:
-    print(f"{shape.area()}cm²")
\ No newline at end of file
+    print(f"{shape.area()}cm²")
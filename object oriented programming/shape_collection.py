@@ -0,0 +1,245 @@
+# Lots of shapes stored column by column
+# Instead of one object per shape, a ShapeCollection keeps one NumPy array per
+# dimension of each kind of shape:
+#   columns["circle"]["radius"][i] = radius of circle number i
+# so the areas of a million circles are one calculation over one array, with
+# no area() call per object.
+#
+# Circle, Square, Triangle and Pizza are still there as small "views": each one
+# only remembers its collection and its row, reads its dimensions from the
+# arrays and overrides area() and perimeter() like any Shape would. Views are
+# always added to a collection the caller made, and it holds their rows until
+# the caller lets go of it.
+#
+# Triangles are right-angled: base and height are the two short sides, so the
+# perimeter is base + height + the long side.
+
+import math
+import time
+
+import numpy as np
+
+dimensions = {"circle": ("radius",),
+              "square": ("side",),
+              "triangle": ("base", "height"),
+              "pizza": ("radius",)}
+
+# pizzas also have a topping, kept in a plain list next to the arrays
+labels = {"pizza": ("topping",)}
+
+# these work on whole arrays, one kind at a time
+area_formulas = {"circle": lambda radius: math.pi * radius ** 2,
+                 "square": lambda side: side ** 2,
+                 "triangle": lambda base, height: 0.5 * base * height,
+                 "pizza": lambda radius: math.pi * radius ** 2}
+
+perimeter_formulas = {"circle": lambda radius: 2 * math.pi * radius,
+                      "square": lambda side: 4 * side,
+                      "triangle": lambda base, height: base + height + np.hypot(base, height),
+                      "pizza": lambda radius: 2 * math.pi * radius}
+
+
+def check(name, values):
+    if np.any(values < 0):
+        raise ValueError(f"{name} can't be less than zero")
+
+
+class ShapeCollection:
+    def __init__(self, capacity=16):
+        self.columns = {kind: {name: np.zeros(capacity) for name in names} for kind, names in dimensions.items()}
+        self.labels = {kind: {name: [] for name in names} for kind, names in labels.items()}
+        self.sizes = dict.fromkeys(dimensions, 0)
+
+    def __len__(self):
+        return sum(self.sizes.values())
+
+    def _make_room(self, kind, extra):
+        # arrays double in size when they fill up, like a list does
+        needed = self.sizes[kind] + extra
+        columns = self.columns[kind]
+        capacity = len(next(iter(columns.values())))
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2)
+        for name, values in columns.items():
+            grown = np.zeros(capacity)
+            grown[:self.sizes[kind]] = values[:self.sizes[kind]]
+            columns[name] = grown
+
+    def extend(self, kind, **values):
+        # adds many shapes of one kind at once, e.g. extend("circle", radius=radii)
+        if kind not in dimensions:
+            raise ValueError(f"{kind} is not a kind of shape")
+        names = dimensions[kind] + labels.get(kind, ())
+        if set(values) != set(names):
+            raise ValueError(f"A {kind} needs {', '.join(names)}")
+
+        numbers = {name: np.atleast_1d(np.asarray(values[name], dtype=np.float64)) for name in dimensions[kind]}
+        count = max(len(value) for value in numbers.values())
+        for name, value in numbers.items():
+            check(name.capitalize(), value)
+
+        texts = {name: [values[name]] * count if isinstance(values[name], str) else list(values[name])
+                 for name in labels.get(kind, ())}
+        if any(len(text) != count for text in texts.values()):
+            raise ValueError(f"Every {kind} needs a {', '.join(texts)}")
+
+        self._make_room(kind, count)
+        start = self.sizes[kind]
+        for name, value in numbers.items():
+            self.columns[kind][name][start:start + count] = value
+        for name, text in texts.items():
+            self.labels[kind][name].extend(text)
+        self.sizes[kind] += count
+        return range(start, start + count)
+
+    def add(self, kind, **values):
+        return self.extend(kind, **values)[0]
+
+    def dimension(self, kind, name):
+        return self.columns[kind][name][:self.sizes[kind]]
+
+    def areas(self, kind):
+        return area_formulas[kind](*(self.dimension(kind, name) for name in dimensions[kind]))
+
+    def perimeters(self, kind):
+        return perimeter_formulas[kind](*(self.dimension(kind, name) for name in dimensions[kind]))
+
+    def total_area(self):
+        return sum(float(self.areas(kind).sum()) for kind in dimensions)
+
+    def total_perimeter(self):
+        return sum(float(self.perimeters(kind).sum()) for kind in dimensions)
+
+    def summary(self):
+        # count, total area and total perimeter for every kind
+        return {kind: {"count": self.sizes[kind],
+                       "area": float(self.areas(kind).sum()),
+                       "perimeter": float(self.perimeters(kind).sum())}
+                for kind in dimensions}
+
+    def view(self, kind, index):
+        return views[kind].at(self, index)
+
+
+class Shape:
+    kind = None
+
+    def __init__(self, collection, **values):
+        self.collection = collection
+        self.index = collection.add(self.kind, **values)
+
+    @classmethod
+    def at(cls, collection, index):
+        # a view of a shape already in the collection
+        shape = cls.__new__(cls)
+        shape.collection = collection
+        shape.index = index
+        return shape
+
+    def _get(self, name):
+        # looked up every time, the array is replaced when the collection grows
+        return float(self.collection.columns[self.kind][name][self.index])
+
+    def area(self):
+        raise NotImplementedError
+
+    def perimeter(self):
+        raise NotImplementedError
+
+
+class Circle(Shape):
+    kind = "circle"
+
+    def __init__(self, collection, radius):
+        super().__init__(collection, radius=radius)
+
+    @property
+    def radius(self):
+        return self._get("radius")
+
+    def area(self):
+        return math.pi * self.radius ** 2
+
+    def perimeter(self):
+        return 2 * math.pi * self.radius
+
+
+class Square(Shape):
+    kind = "square"
+
+    def __init__(self, collection, side):
+        super().__init__(collection, side=side)
+
+    @property
+    def side(self):
+        return self._get("side")
+
+    def area(self):
+        return self.side ** 2
+
+    def perimeter(self):
+        return 4 * self.side
+
+
+class Triangle(Shape):
+    kind = "triangle"
+
+    def __init__(self, collection, base, height):
+        super().__init__(collection, base=base, height=height)
+
+    @property
+    def base(self):
+        return self._get("base")
+
+    @property
+    def height(self):
+        return self._get("height")
+
+    def area(self):
+        return 0.5 * self.base * self.height
+
+    def perimeter(self):
+        return self.base + self.height + math.hypot(self.base, self.height)
+
+
+class Pizza(Circle):
+    kind = "pizza"
+
+    def __init__(self, collection, topping, radius):
+        Shape.__init__(self, collection, topping=topping, radius=radius)
+
+    @property
+    def topping(self):
+        return self.collection.labels[self.kind]["topping"][self.index]
+
+
+views = {"circle": Circle, "square": Square, "triangle": Triangle, "pizza": Pizza}
+
+
+def main():
+    rng = np.random.default_rng(1)
+    collection = ShapeCollection()
+    count = 1_000_000
+    collection.extend("circle", radius=rng.uniform(1, 10, count))
+    collection.extend("square", side=rng.uniform(1, 10, count))
+    collection.extend("triangle", base=rng.uniform(1, 10, count), height=rng.uniform(1, 10, count))
+    collection.extend("pizza", radius=rng.uniform(10, 20, count), topping="BBQ")
+
+    start = time.perf_counter()
+    summary = collection.summary()
+    seconds = time.perf_counter() - start
+
+    print(f"{len(collection):,} shapes in {seconds * 1000:.0f}ms")
+    for kind, totals in summary.items():
+        print(f"{kind:>8}: {totals['count']:,} | area {totals['area']:,.0f}cm² | "
+              f"perimeter {totals['perimeter']:,.0f}cm")
+
+    start = time.perf_counter()
+    one_by_one = sum(collection.view("circle", index).area() for index in range(count))
+    seconds = time.perf_counter() - start
+    print(f"circle areas one view at a time: {one_by_one:,.0f}cm² in {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,11 @@
 # super() - Function used in a child class (subclass) to call methods from a parent class (superclass)
 #           Allows you to extend the functionality of the inherited methods
 
+import shape_collection
+
+# every shape's dimensions go in here
+shapes = shape_collection.ShapeCollection()
+
 class Shape:
     def __init__(self, colour, is_filled):
         self.colour = colour
@@ -13,39 +18,38 @@ class Circle(Shape):
     def __init__(self, colour, is_filled, radius):
         # super().__init__(colour, is_filled)
         Shape.__init__(self,colour, is_filled)
-        self.radius = radius
+        self.shape = shape_collection.Circle(shapes, radius)
 
     def describe(self):
         super().describe()
-        print(f"It is circle of area of {3.14 * int(self.radius) * int(self.radius):.1f}cm^2")
+        print(f"It is circle of area of {self.shape.area():.1f}cm^2")
 
 
 class Square(Shape):
     def __init__(self, colour, is_filled, width):
         super().__init__(colour, is_filled)
-        self.width = width
+        self.shape = shape_collection.Square(shapes, width)
 
     def describe(self):
         super().describe()
-        print(f"It is square of area {int(self.width) * int(self.width):.1f}cm^2")
+        print(f"It is square of area {self.shape.area():.1f}cm^2")
 
 class Triangle(Shape):
     def __init__(self, colour, is_filled, width, height):
         super().__init__(colour, is_filled)
-        self.width = width
-        self.height = height
+        self.shape = shape_collection.Triangle(shapes, width, height)
 
     def describe(self):
         super().describe()
-        print(f"It is triangle of area {0.5 * int(self.width) * int(self.height):.1f}cm^2")
+        print(f"It is triangle of area {self.shape.area():.1f}cm^2")
 
 circle = Circle(colour="Red", is_filled=False, radius="4")
 square = Square(colour="Black", is_filled=True, width="5")
 triangle = Triangle(colour="Blue", is_filled=True, width="7", height="8")
 
-# print(circle.radius)
-# print(square.width)
-# print(triangle.height)
+# print(circle.shape.radius)
+# print(square.shape.side)
+# print(triangle.shape.height)
 circle.describe()
 square.describe()
 triangle.describe()
@@ -0,0 +1,119 @@
+# Question bank for the quiz, loaded from questions.json
+# Answers are stored as option numbers (A=0, B=1, ...) in a NumPy array, so
+# a whole pile of answer sheets can be marked in one comparison:
+#   sheets[s, q] = option chosen on sheet s for question q (blank = 255)
+#   correct      = sheets == answers
+
+import json
+import os
+import string
+import time
+
+import numpy as np
+
+letters = string.ascii_uppercase
+blank = 255
+bank_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "questions.json")
+
+
+class QuestionBank:
+    def __init__(self, questions):
+        self.questions = tuple(item["question"] for item in questions)
+        self.options = tuple(tuple(item["options"]) for item in questions)
+        self.answers = np.array([letters.index(item["answer"].upper()) for item in questions], dtype=np.uint8)
+        self.option_counts = np.array([len(options) for options in self.options], dtype=np.uint8)
+
+        if np.any(self.answers >= self.option_counts):
+            raise ValueError("Every answer must be one of its question's options")
+
+    @classmethod
+    def load(cls, file_path):
+        with open(file_path, encoding="utf-8") as file:
+            return cls(json.load(file)["questions"])
+
+    def __len__(self):
+        return len(self.questions)
+
+    def choices(self, number):
+        # the letters that are a valid answer to one question, e.g. ("A", "B", "C", "D")
+        return tuple(letters[:self.option_counts[number]])
+
+    def labelled_options(self, number):
+        # ("A. 116", "B. 117", ...) like the old options tuple
+        return tuple(f"{letter}. {option}" for letter, option in zip(letters, self.options[number]))
+
+    def answer_letter(self, number):
+        return letters[self.answers[number]]
+
+    def sample(self, count, rng=None):
+        # count different question numbers in random order
+        rng = rng or np.random.default_rng()
+        return rng.choice(len(self), size=count, replace=False)
+
+    def parse_sheets(self, sheets):
+        # ["CDAAB", "CDB B", ...] -> uint8 array, anything that isn't a valid letter is blank
+        # encoded before upper(), which can make a non-ASCII letter longer ("ß" -> "SS")
+        width = len(self)
+        data = b"".join(sheet.encode("ascii", "replace").upper()[:width].ljust(width) for sheet in sheets)
+        chosen = np.frombuffer(data, dtype=np.uint8).reshape(-1, width) - np.uint8(ord("A"))
+        chosen[chosen >= self.option_counts] = blank
+        return chosen
+
+    def option_histogram(self, sheets):
+        # how many sheets picked each option of each column, the last column is blank
+        sheets = np.asarray(sheets, dtype=np.uint8)
+        width = int(self.option_counts.max()) + 1
+        columns = sheets.shape[1]
+        picked = np.where(sheets == blank, width - 1, sheets).astype(np.int64)
+        offsets = np.arange(columns) * width
+        histogram = np.bincount((picked + offsets).ravel(), minlength=columns * width)
+        return histogram.reshape(columns, width)
+
+    def grade(self, sheets, questions=None):
+        # sheets has one column per question in questions (all questions by default)
+        sheets = np.asarray(sheets, dtype=np.uint8)
+        questions = np.arange(len(self)) if questions is None else np.asarray(questions)
+        answers = self.answers[questions]
+
+        correct = sheets == answers
+        scores = correct.sum(axis=1)
+        right = correct.mean(axis=0)
+
+        # discrimination: do people who get this question right score higher overall?
+        score_spread = scores - scores.mean()
+        item_spread = correct - right
+        spread = np.sqrt((item_spread ** 2).sum(axis=0) * (score_spread ** 2).sum())
+        with np.errstate(divide="ignore", invalid="ignore"):
+            discrimination = np.where(spread > 0, (item_spread * score_spread[:, None]).sum(axis=0) / spread, 0)
+
+        return {"scores": scores,
+                "percent": scores * 100 // len(questions),
+                "difficulty": 1 - right,
+                "discrimination": discrimination,
+                "option_histogram": self.option_histogram(sheets)}
+
+
+def main():
+    bank = QuestionBank.load(bank_path)
+    rng = np.random.default_rng(1)
+    sheets = 1_000_000
+
+    # pretend students: right about 70% of the time, otherwise a random letter or blank
+    answers = np.where(rng.random((sheets, len(bank))) < 0.7, bank.answers,
+                       rng.integers(0, 5, size=(sheets, len(bank)))).astype(np.uint8)
+    answers[answers == 4] = blank
+
+    start = time.perf_counter()
+    results = bank.grade(answers)
+    seconds = time.perf_counter() - start
+
+    print(f"Graded {sheets:,} answer sheets in {seconds * 1000:.0f}ms")
+    print(f"Average score: {results['percent'].mean():.1f}%")
+    for number in range(len(bank)):
+        print(f"Q{number + 1}: difficulty {results['difficulty'][number]:.2f} | "
+              f"discrimination {results['discrimination'][number]:.2f} | "
+              f"picked {results['option_histogram'][number].tolist()}")
+
+
+if __name__ == "__main__":
+    main()
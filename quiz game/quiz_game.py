@@ -1,18 +1,11 @@
 # Python quiz game
 
-questions = ("How many elements are in the periodic table?: ",
-             "Which animal lays the largest eggs?: ",
-             "What is the most abundant gas in Earth's atmosphere?: ",
-             "How many bones are in the human body?: ",
-             "Which planet in the solar system is the hottest?: ")
-
-options = (("A. 116", "B. 117", "C. 118", "D. 119"),
-           ("A. Whale", "B. Crocodile", "C. Elephant", "D. Ostrich"),
-           ("A. Nitrogen", "B. Oxygen", "C. Carbon-Dioxide", "D. Hydrogen"),
-           ("A. 206", "B. 207", "C. 208", "D. 209"),
-           ("A. Mercury", "B. Venus", "C. Earth", "D. Mars"))
-
-answers = ("C", "D", "A", "A", "B")
+from question_bank import QuestionBank, bank_path
+
+bank = QuestionBank.load(bank_path)
+questions = bank.questions
+options = tuple(bank.labelled_options(number) for number in range(len(bank)))
+answers = tuple(bank.answer_letter(number) for number in range(len(bank)))
 guesses = []
 score = 0
 question_num = 0
@@ -24,8 +17,9 @@ for question in questions:
         print(option)
 
     while True:
-        guess = input("Choose (A, B, C, D): ").upper()
-        if guess in answers:
+        choices = bank.choices(question_num)
+        guess = input(f"Choose ({', '.join(choices)}): ").upper()
+        if guess in choices:
             guesses.append(guess)
             if guess == answers[question_num]:
                 score += 1
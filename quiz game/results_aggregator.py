@@ -0,0 +1,193 @@
+# Live results for a quiz taken by lots of people
+# Submissions come in as JSON lines, e.g. {"guesses": "CDBAB"} or
+# {"guesses": ["C", "D", "B", "A", "B"]}, and are read in chunks.
+#
+# Only counts are kept, so memory doesn't grow with the number of submissions:
+#   score_counts[k]     = submissions with k correct answers
+#   option_counts[q, o] = submissions that picked option o for question q (last column is blank)
+# A score can only be 0..len(questions), so score_counts is an exact sketch of
+# the scores: mean, spread and percentiles all come from it, and two
+# aggregators are merged by adding their counts.
+#
+#   python results_aggregator.py < submissions.jsonl
+#   python results_aggregator.py --save part1.json < part1.jsonl
+#   python results_aggregator.py --merge part1.json part2.json
+
+import itertools
+import json
+import sys
+import time
+
+import numpy as np
+
+from question_bank import QuestionBank, bank_path, letters
+
+
+class ResultsAggregator:
+    def __init__(self, bank):
+        self.bank = bank
+        self.count = 0
+        self.invalid = 0
+        self.score_counts = np.zeros(len(bank) + 1, dtype=np.int64)
+        self.option_counts = np.zeros((len(bank), int(bank.option_counts.max()) + 1), dtype=np.int64)
+
+    def add_sheets(self, sheets):
+        # sheets is a (submissions x questions) array like QuestionBank.parse_sheets returns
+        sheets = np.asarray(sheets, dtype=np.uint8)
+        scores = (sheets == self.bank.answers).sum(axis=1)
+        self.score_counts += np.bincount(scores, minlength=len(self.score_counts))
+        self.option_counts += self.bank.option_histogram(sheets)
+        self.count += len(sheets)
+
+    def add_submissions(self, submissions):
+        # a submission that couldn't be read is None and is only counted
+        sheets = []
+        for submission in submissions:
+            guesses = submission.get("guesses") if isinstance(submission, dict) else None
+            if isinstance(guesses, (str, list)):
+                sheets.append(guess_string(guesses))
+            else:
+                self.invalid += 1
+        if sheets:
+            self.add_sheets(self.bank.parse_sheets(sheets))
+
+    def merge(self, other):
+        if other.score_counts.shape != self.score_counts.shape:
+            raise ValueError("Can't merge results of different quizzes")
+        self.count += other.count
+        self.invalid += other.invalid
+        self.score_counts += other.score_counts
+        self.option_counts += other.option_counts
+        return self
+
+    def percent_scores(self):
+        return np.arange(len(self.score_counts)) * 100 / len(self.bank)
+
+    def mean(self):
+        if not self.count:
+            return 0.0
+        return float(self.score_counts @ self.percent_scores() / self.count)
+
+    def std(self):
+        if not self.count:
+            return 0.0
+        spread = (self.percent_scores() - self.mean()) ** 2
+        return float(np.sqrt(self.score_counts @ spread / self.count))
+
+    def percentile(self, q):
+        # the lowest score that at least q% of submissions are at or below
+        if not self.count:
+            return 0.0
+        rank = max(1, int(np.ceil(q / 100 * self.count)))
+        return float(self.percent_scores()[np.searchsorted(np.cumsum(self.score_counts), rank)])
+
+    def correct_rate(self):
+        # fraction of submissions that got each question right
+        if not self.count:
+            return np.zeros(len(self.bank))
+        rows = np.arange(len(self.bank))
+        return self.option_counts[rows, self.bank.answers] / self.count
+
+    def to_dict(self):
+        return {"count": self.count,
+                "invalid": self.invalid,
+                "score_counts": self.score_counts.tolist(),
+                "option_counts": self.option_counts.tolist()}
+
+    @classmethod
+    def from_dict(cls, bank, data):
+        aggregator = cls(bank)
+        other_scores = np.array(data["score_counts"], dtype=np.int64)
+        other_options = np.array(data["option_counts"], dtype=np.int64)
+        if other_scores.shape != aggregator.score_counts.shape or other_options.shape != aggregator.option_counts.shape:
+            raise ValueError("Saved results are for a different quiz")
+        aggregator.count = int(data["count"])
+        aggregator.invalid = int(data.get("invalid", 0))
+        aggregator.score_counts = other_scores
+        aggregator.option_counts = other_options
+        return aggregator
+
+    def save(self, file_path):
+        with open(file_path, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file)
+
+    @classmethod
+    def load(cls, bank, file_path):
+        with open(file_path, encoding="utf-8") as file:
+            return cls.from_dict(bank, json.load(file))
+
+    def summary(self):
+        return (f"{self.count:,} submissions | mean {self.mean():.1f}% | std {self.std():.1f} | "
+                f"median {self.percentile(50):.0f}% | p90 {self.percentile(90):.0f}% | "
+                f"invalid lines {self.invalid:,}")
+
+
+def guess_string(guesses):
+    # "CDBAB" or ["C", "D", "B", "A", "B"] -> "CDBAB", missing guesses become blanks
+    if isinstance(guesses, str):
+        return guesses
+    return "".join(guess if isinstance(guess, str) and len(guess) == 1 else " " for guess in guesses)
+
+
+def read_submissions(lines):
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+
+def aggregate(lines, aggregator, chunk_size=10_000, every=100_000, report=None):
+    # report(aggregator) is called about every `every` submissions
+    # (a bad line counts towards it too)
+    submissions = read_submissions(lines)
+    next_report = every
+    while True:
+        chunk = list(itertools.islice(submissions, chunk_size))
+        if not chunk:
+            break
+        aggregator.add_submissions(chunk)
+        if report and aggregator.count + aggregator.invalid >= next_report:
+            report(aggregator)
+            next_report += every
+    return aggregator
+
+
+def print_results(aggregator):
+    print(aggregator.summary())
+    width = aggregator.option_counts.shape[1] - 1
+    for number, (rate, counts) in enumerate(zip(aggregator.correct_rate(), aggregator.option_counts)):
+        picked = " ".join(f"{letter}:{count}" for letter, count in zip(letters[:width], counts))
+        print(f"Q{number + 1}: {rate:.0%} correct | {picked} blank:{counts[-1]}")
+
+
+def live_report(aggregator):
+    print(aggregator.summary(), file=sys.stderr)
+
+
+def main():
+    bank = QuestionBank.load(bank_path)
+    aggregator = ResultsAggregator(bank)
+    args = sys.argv[1:]
+
+    if args[:1] == ["--merge"]:
+        for file_path in args[1:]:
+            aggregator.merge(ResultsAggregator.load(bank, file_path))
+        print_results(aggregator)
+        return
+
+    start = time.perf_counter()
+    aggregate(sys.stdin, aggregator, report=live_report)
+    seconds = time.perf_counter() - start
+
+    if args[:1] == ["--save"]:
+        aggregator.save(args[1])
+    print_results(aggregator)
+    print(f"Read in {seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
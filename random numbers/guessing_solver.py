@@ -0,0 +1,139 @@
+# Plays the number guessing game automatically
+# The guesser always tries the middle of what is left (bisection), so it
+# needs at most ceil(log2(size + 1)) guesses, where size = upper - lower + 1.
+#
+# A whole batch of games is played at once with NumPy: every game keeps its
+# own lower and upper bound in uint64 arrays, so ranges up to 2^64 - 1 work.
+#
+# The oracle can also lie: with lie_probability, "Too Low" and "Too High"
+# are swapped (at most max_lies times per game, if given). The guesser then asks
+# about each middle repeats times and takes the majority, and starts again
+# from the full range when the bounds cross.
+
+import time
+
+import numpy as np
+
+
+def check_guess(guess, number):
+    # the game's feedback: "correct", "low" (Too Low!) or "high" (Too High!)
+    if guess == number:
+        return "correct"
+    elif guess < number:
+        return "low"
+    else:
+        return "high"
+
+
+def play(number, lower, upper):
+    # one game with plain Python ints, using the same feedback as the game
+    guesses = 0
+    while True:
+        guess = lower + (upper - lower) // 2
+        guesses += 1
+        answer = check_guess(guess, number)
+        if answer == "correct":
+            return guesses
+        elif answer == "low":
+            lower = guess + 1
+        else:
+            upper = guess - 1
+
+
+def guess_bound(lower, upper):
+    # same as ceil(log2(upper - lower + 2)), without float rounding for huge ranges
+    return (upper - lower + 1).bit_length()
+
+
+def play_batch(numbers, lower, upper, rng, lie_probability=0.0, max_lies=None, repeats=1, max_guesses=10_000):
+    # the arrays only hold games still being played, finished ones are dropped
+    number = np.asarray(numbers, dtype=np.uint64)
+    ids = np.arange(len(number))
+    low = np.full(len(number), lower, dtype=np.uint64)
+    high = np.full(len(number), upper, dtype=np.uint64)
+    count = np.zeros(len(number), dtype=np.int64)
+    # max_lies=None lets the oracle lie any number of times
+    lies_left = np.full(len(number), np.iinfo(np.int64).max if max_lies is None else max_lies, dtype=np.int64)
+    guesses = np.zeros(len(number), dtype=np.int64)
+    one = np.uint64(1)
+
+    while ids.size:
+        middle = low + (high - low) // 2
+        found = middle == number
+        too_low = middle < number
+
+        if lie_probability:
+            # votes for "Too Low!" out of repeats questions, lies flip the answer
+            count += np.where(found, 1, repeats)
+            votes = np.zeros(ids.size, dtype=np.int64)
+            for _ in range(repeats):
+                lie = (rng.random(ids.size) < lie_probability) & (lies_left > 0) & ~found
+                lies_left -= lie
+                votes += too_low ^ lie
+            says_low = votes * 2 > repeats
+        else:
+            count += 1
+            says_low = too_low
+
+        # middle - 1 / middle + 1 would wrap around at the ends of uint64,
+        # and when middle is already a bound the bounds have crossed anyway
+        crossed = ~found & ((~says_low & (middle == low)) | (says_low & (middle == high)))
+        low = np.where(~found & says_low & ~crossed, middle + one, low)
+        high = np.where(~found & ~says_low & ~crossed, middle - one, high)
+        crossed |= low > high
+
+        if crossed.any():
+            # a lie pushed the number out of the bounds: start again
+            low[crossed] = lower
+            high[crossed] = upper
+
+        finished = found | (count >= max_guesses)
+        if finished.any():
+            guesses[ids[finished]] = count[finished]
+            playing = ~finished
+            ids, number, low, high = ids[playing], number[playing], low[playing], high[playing]
+            count, lies_left = count[playing], lies_left[playing]
+
+    return guesses
+
+
+def simulate(games=1_000_000, lower=1, upper=2 ** 63, seed=None, batch_size=1_000_000, max_guesses=10_000, **oracle):
+    rng = np.random.default_rng(seed)
+    counts = []
+    done = 0
+
+    while done < games:
+        size = min(batch_size, games - done)
+        # integers() can't take a high of 2^64, so draw the offset from lower instead
+        offsets = rng.integers(0, upper - lower, size=size, dtype=np.uint64, endpoint=True)
+        numbers = offsets + np.uint64(lower)
+        counts.append(play_batch(numbers, lower, upper, rng, max_guesses=max_guesses, **oracle))
+        done += size
+
+    guesses = np.concatenate(counts)
+    return {"games": games,
+            "bound": guess_bound(lower, upper),
+            "mean": float(guesses.mean()),
+            "max": int(guesses.max()),
+            # games that never found the number within max_guesses
+            "failed": int(np.count_nonzero(guesses >= max_guesses)),
+            "distribution": np.bincount(guesses)}
+
+
+def main():
+    print("----Number Guessing Solver----")
+    for lower, upper in ((1, 10), (1, 1_000_000), (1, 2 ** 63)):
+        start = time.perf_counter()
+        results = simulate(1_000_000, lower, upper, seed=1)
+        seconds = time.perf_counter() - start
+        print(f"{lower}-{upper}: mean {results['mean']:.2f} | max {results['max']} | "
+              f"log2 bound {results['bound']} | 1,000,000 games in {seconds:.2f}s")
+
+    results = simulate(100_000, 1, 1_000_000, seed=2, lie_probability=0.1, repeats=5)
+    print(f"10% lies, 5 votes per guess: mean {results['mean']:.2f} | max {results['max']}")
+    results = simulate(100_000, 1, 1_000_000, seed=3, lie_probability=0.5, max_lies=2, repeats=5)
+    print(f"up to 2 lies per game, 5 votes per guess: mean {results['mean']:.2f} | max {results['max']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
 import random
 
+from guessing_solver import check_guess
+
 lower = 1
 upper = 10
 no_guesses = 0
@@ -11,17 +13,18 @@ while True:
     if guess.isdigit():
         guess = int(guess)
         no_guesses += 1
-        if guess == number:
+        answer = check_guess(guess, number)
+        if answer == "correct":
             # no_guesses += 1
             print(f"CORRECT GUESS.The answer is {guess}")
             print(f"The number of guesses is: {no_guesses}")
             break
-        elif guess < number:
+        elif answer == "low":
             # no_guesses += 1
             print("Too Low! Try again.")
             print(f"The number of guesses is: {no_guesses}")
             continue
-        elif guess > number:
+        elif answer == "high":
             # no_guesses += 1
             print("Too High! Try again.")
             print(f"The number of guesses is: {no_guesses}")
@@ -1,5 +1,7 @@
 import random
 
+from rps_tournament import judge
+
 options = ("rock", "paper", "scissors")
 results = ("You win", "You Lose", "Draw")
 your_score = 0
@@ -24,14 +26,9 @@ while True:
             print(f"Your score:{your_score} | Computer score:{computer_score}")
             continue
 
-    if your_move == computer_move:
-        result = results[2]
-    elif (your_move == "rock" and computer_move != "paper") or \
-            (your_move == "paper" and computer_move != "scissors") or \
-            (your_move == "scissors" and computer_move != "rock"):
-        result = results[0]
-    else:
-        result = results[1]
+    # one table lookup instead of comparing the move names
+    outcome = judge(your_move, computer_move)
+    result = {"win": results[0], "lose": results[1], "draw": results[2]}[outcome]
 
     if result == results[0]:
         your_score += 5
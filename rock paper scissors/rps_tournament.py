@@ -0,0 +1,160 @@
+# Rock paper scissors tournaments between computer strategies
+# Moves are small ints: 0 rock, 1 paper, 2 scissors.
+# (a - b) % 3 is 0 for a draw, 1 when a wins and 2 when a loses, so one
+# 3x3 table judges any pair of moves.
+#
+# Each match plays many independent games side by side ("lanes") as NumPy
+# arrays, one round at a time, so a million rounds is a few hundred steps.
+
+import itertools
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+moves = ("rock", "paper", "scissors")
+
+# points for the first player: outcome_table[a][b]
+outcome_table = np.array([[0, -1, 1],
+                          [1, 0, -1],
+                          [-1, 1, 0]])
+
+
+def judge(a, b):
+    # "win", "lose" or "draw" for a single round of move names
+    return ("draw", "win", "lose")[(moves.index(a) - moves.index(b)) % 3]
+
+
+def beat(move):
+    # the move that beats move: paper beats rock and so on
+    return (move + 1) % 3
+
+
+class RandomStrategy:
+    name = "random"
+
+    def reset(self, lanes, rng):
+        self.lanes = lanes
+        self.rng = rng
+
+    def choose(self):
+        return self.rng.integers(0, 3, size=self.lanes)
+
+    def update(self, mine, theirs):
+        pass
+
+
+class CycleStrategy:
+    # rock, paper, scissors, rock, ... easy to read for the smart strategies
+    name = "cycle"
+
+    def reset(self, lanes, rng):
+        self.move = rng.integers(0, 3, size=lanes)
+
+    def choose(self):
+        return self.move
+
+    def update(self, mine, theirs):
+        self.move = (self.move + 1) % 3
+
+
+class FrequencyStrategy:
+    # plays what beats the opponent's most common move so far
+    name = "frequency"
+
+    def reset(self, lanes, rng):
+        self.rng = rng
+        self.counts = np.zeros((lanes, 3), dtype=np.int64)
+        self.rows = np.arange(lanes)
+
+    def choose(self):
+        # a little noise breaks ties between equally common moves
+        noise = self.rng.random(self.counts.shape)
+        return beat(np.argmax(self.counts + noise, axis=1))
+
+    def update(self, mine, theirs):
+        self.counts[self.rows, theirs] += 1
+
+
+class MarkovStrategy:
+    # learns which move the opponent plays after each of their moves
+    name = "markov"
+
+    def reset(self, lanes, rng):
+        self.rng = rng
+        self.counts = np.zeros((lanes, 3, 3), dtype=np.int64)
+        self.rows = np.arange(lanes)
+        self.last = rng.integers(0, 3, size=lanes)
+
+    def choose(self):
+        predicted = self.counts[self.rows, self.last] + self.rng.random((len(self.rows), 3))
+        return beat(np.argmax(predicted, axis=1))
+
+    def update(self, mine, theirs):
+        self.counts[self.rows, self.last, theirs] += 1
+        self.last = theirs
+
+
+strategies = {strategy.name: strategy for strategy in
+              (RandomStrategy, CycleStrategy, FrequencyStrategy, MarkovStrategy)}
+
+
+def play_match(first, second, rounds, lanes, seed):
+    # first and second are strategy classes, returns (wins, losses, draws) for first over rounds * lanes games
+    rng = np.random.default_rng(seed)
+    a = first()
+    b = second()
+    a.reset(lanes, rng)
+    b.reset(lanes, rng)
+    wins = losses = 0
+
+    for _ in range(rounds):
+        move_a = a.choose()
+        move_b = b.choose()
+        points = outcome_table[move_a, move_b]
+        wins += int(np.count_nonzero(points == 1))
+        losses += int(np.count_nonzero(points == -1))
+        a.update(move_a, move_b)
+        b.update(move_b, move_a)
+
+    return wins, losses, rounds * lanes - wins - losses
+
+
+def tournament(players=tuple(strategies.values()), total_rounds=1_000_000, lanes=10_000, seed=None, workers=None):
+    # round robin: every strategy class plays every other one
+    # the classes themselves go to the worker processes, so any strategy with
+    # reset/choose/update works without being added to strategies, as long
+    # as it is defined at the top level of a module (so it can be pickled)
+    rounds = math.ceil(total_rounds / lanes)
+    pairs = list(itertools.combinations(range(len(players)), 2))
+    seeds = np.random.SeedSequence(seed).spawn(len(pairs))
+    args = ([players[i] for i, _ in pairs], [players[j] for _, j in pairs],
+            [rounds] * len(pairs), [lanes] * len(pairs), seeds)
+
+    if workers == 1:
+        results = list(map(play_match, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(play_match, *args))
+
+    # score[i][j] = (wins - losses) / games for players[i] against players[j]
+    score = np.zeros((len(players), len(players)))
+    for (i, j), (wins, losses, draws) in zip(pairs, results):
+        games = wins + losses + draws
+        score[i, j] = (wins - losses) / games
+        score[j, i] = -score[i, j]
+    return score
+
+
+def main():
+    players = tuple(strategies.values())
+    names = [player.name for player in players]
+    score = tournament(players, seed=1)
+
+    print(" " * 10 + "".join(f"{name:>10}" for name in names))
+    for name, row in zip(names, score):
+        print(f"{name:10}" + "".join(f"{value:>10.3f}" for value in row))
+
+
+if __name__ == "__main__":
+    main()
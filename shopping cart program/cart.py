@@ -0,0 +1,71 @@
+# Shopping cart with one line per (food, price)
+# Adding the same food at the same price again just raises its quantity,
+# and the total is updated on every add and remove, so printing the cart
+# or reading the total never has to pair foods with prices again.
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "money"))
+from money import Money
+
+
+class Cart:
+    def __init__(self):
+        # (food, price in cents) -> quantity, kept in the order first added
+        self.items = {}
+        self.total_cents = 0
+
+    @property
+    def total(self):
+        return Money(self.total_cents)
+
+    def add(self, food, price, quantity=1):
+        if quantity <= 0:
+            raise ValueError("Quantity must be greater than 0")
+        key = (food, Money.of(price).cents)
+        self.items[key] = self.items.get(key, 0) + quantity
+        self.total_cents += key[1] * quantity
+
+    def remove(self, food, price, quantity=1):
+        if quantity <= 0:
+            raise ValueError("Quantity must be greater than 0")
+        key = (food, Money.of(price).cents)
+        if key not in self.items:
+            raise KeyError(f"{food} at {Money(key[1])} is not in the cart")
+
+        quantity = min(quantity, self.items[key])
+        self.items[key] -= quantity
+        if self.items[key] == 0:
+            del self.items[key]
+        self.total_cents -= key[1] * quantity
+
+    def __len__(self):
+        return len(self.items)
+
+    def lines(self):
+        for (food, cents), quantity in self.items.items():
+            yield food, Money(cents), quantity
+
+    def render(self):
+        return "\n".join(f"{food:15} Ksh{price:.2f}" if quantity == 1 else
+                         f"{food:15} Ksh{price:.2f} x{quantity}"
+                         for food, price, quantity in self.lines())
+
+
+def main():
+    cart = Cart()
+    for i in range(100_000):
+        cart.add(f"food{i}", f"{i % 1000}.50")
+
+    start = time.perf_counter()
+    text = cart.render()
+    render_time = time.perf_counter() - start
+
+    print(f"{len(cart):,} lines rendered in {render_time * 1000:.1f}ms ({len(text):,} characters)")
+    print(f"Your total is: Ksh {cart.total:.2f}")
+
+
+if __name__ == "__main__":
+    main()
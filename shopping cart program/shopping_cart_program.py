@@ -1,10 +1,8 @@
 # shopping cart program
 
-from operator import index
+from cart import Cart, Money
 
-foods = []
-prices = []
-total = 0
+cart = Cart()
 
 while True:
     food = input("Enter a food to buy (q to quit): ")
@@ -14,9 +12,8 @@ while True:
         while True:
             price = input(f"Enter the price of {food}. (Should be numeric): Ksh ")
             try:
-                price = float(price)
-                foods.append(food)
-                prices.append(price)
+                price = Money.of(price)
+                cart.add(food, price)
                 break
             except ValueError:
                 print("Invalid price. Please enter a number.")
@@ -25,11 +22,6 @@ while True:
 
 print("-------YOUR CART-------")
 
-for price in prices:
-    total += price
-
-for food in foods:
-    for price in prices:
-        if foods.index(food) == prices.index(price):
-            print(f"{food:15} {price}")
-print(f"Your total is: Ksh {total:.2f}")
\ No newline at end of file
+if cart:
+    print(cart.render())
+print(f"Your total is: Ksh {cart.total:.2f}")
\ No newline at end of file
@@ -0,0 +1,85 @@
+# Table driven payouts for the slot machine
+# Every possible row is scored once when the paytable is loaded, so a payout
+# is a single array lookup no matter how many symbols or rules there are.
+#
+# paytable.json layout:
+#   symbols - the reel symbols, a row stores the index of each one
+#   reels   - number of reels in a row
+#   wild    - symbol that counts as any other symbol (or null)
+#   pays    - {symbol: {count: multiplier}}, where count is how many reels
+#             show that symbol. A row with more matches than any listed
+#             count pays the biggest listed count below it.
+
+import json
+
+import numpy as np
+
+max_table_size = 10_000_000
+
+
+class Paytable:
+    def __init__(self, symbols, pays, reels=3, wild=None):
+        self.symbols = list(symbols)
+        self.reels = reels
+        self.wild = wild
+        self.symbol_index = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+        size = len(self.symbols) ** reels
+        if size > max_table_size:
+            raise ValueError(f"{len(self.symbols)} symbols on {reels} reels is too many rows to precompute")
+
+        # row code = index of reel 0 * S^(n-1) + ... + index of last reel
+        self.weights = len(self.symbols) ** np.arange(reels - 1, -1, -1, dtype=np.int64)
+        self.table = self._compile(pays)
+
+    @classmethod
+    def load(cls, file_path):
+        with open(file_path, encoding="utf-8") as file:
+            data = json.load(file)
+        return cls(data["symbols"], data["pays"], data.get("reels", 3), data.get("wild"))
+
+    def _compile(self, pays):
+        count = len(self.symbols)
+        # every row there is, one per line: shape (S^reels, reels)
+        rows = np.indices((count,) * self.reels).reshape(self.reels, -1).T
+        wild = self.symbol_index.get(self.wild, -1)
+        table = np.zeros(len(rows))
+
+        for symbol, rules in pays.items():
+            s = self.symbol_index[symbol]
+            # counts are strings in JSON but may be ints when built in code
+            rules = {int(c): multiplier for c, multiplier in rules.items()}
+            # pay_by_count[c] is what c matching reels pay
+            pay_by_count = np.zeros(self.reels + 1)
+            for matches in range(1, self.reels + 1):
+                listed = [c for c in rules if c <= matches]
+                if listed:
+                    pay_by_count[matches] = rules[max(listed)]
+
+            if s == wild:
+                matches = (rows == s).sum(axis=1)
+            else:
+                matches = ((rows == s) | (rows == wild)).sum(axis=1)
+            table = np.maximum(table, pay_by_count[matches])
+
+        if np.all(table == table.astype(np.int64)):
+            table = table.astype(np.int64)
+        return table
+
+    def index(self, row):
+        # ['🍒', '🍒', '⭐'] -> [0, 0, 4]
+        return [self.symbol_index[symbol] for symbol in row]
+
+    def multiplier(self, rows):
+        # works for a single row [0, 0, 4] or a batch of rows [[0, 0, 4], ...]
+        rows = np.asarray(rows)
+        if rows.shape[-1] != self.reels:
+            raise ValueError(f"Expected rows of {self.reels} reels, got {rows.shape[-1]}")
+        return self.table[rows @ self.weights]
+
+    def payout(self, rows, bet):
+        return self.multiplier(rows) * bet
+
+    def expected_rtp(self):
+        # every row is equally likely, so RTP is the average multiplier
+        return float(self.table.mean())
@@ -0,0 +1,88 @@
+# Runs whole main()-style sessions of the slot machine on every CPU core
+# A player starts with a balance and keeps betting until broke or a stop rule fires.
+#
+# Sessions are split into fixed size chunks and every chunk gets its own
+# seed from one SeedSequence, so the same seed gives the same results
+# whatever the number of workers.
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from slot_machine import paytable
+from slot_simulator import spin_rows
+
+
+def play_sessions(seed, sessions, balance=100, bet=1, max_spins=10_000, target=None):
+    rng = np.random.default_rng(seed)
+    balances = np.full(sessions, balance, dtype=paytable.table.dtype)
+    lengths = np.zeros(sessions, dtype=np.int64)
+    active = np.ones(sessions, dtype=bool)
+
+    # every step spins once for each session that is still playing
+    for _ in range(max_spins):
+        live = np.flatnonzero(active)
+        if live.size == 0:
+            break
+
+        # like main(), a bet can never be bigger than the balance
+        bets = np.minimum(bet, balances[live])
+        payouts = paytable.payout(spin_rows(live.size, rng), bets)
+        balances[live] += payouts - bets
+        lengths[live] += 1
+
+        finished = balances[live] <= 0
+        if target is not None:
+            finished |= balances[live] >= target
+        active[live[finished]] = False
+
+    return balances, lengths
+
+
+def summarize(values):
+    return {"mean": float(values.mean()),
+            "min": values.min().item(),
+            "p5": float(np.percentile(values, 5)),
+            "median": float(np.median(values)),
+            "p95": float(np.percentile(values, 95)),
+            "max": values.max().item()}
+
+
+def simulate_sessions(sessions=10_000, workers=None, seed=None, chunk_size=1_000,
+                      balance=100, bet=1, max_spins=10_000, target=None):
+    chunks = math.ceil(sessions / chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(chunks)
+    sizes = [min(chunk_size, sessions - i * chunk_size) for i in range(chunks)]
+    play = partial(play_sessions, balance=balance, bet=bet, max_spins=max_spins, target=target)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(play, seeds, sizes))
+
+    balances = np.concatenate([result[0] for result in results])
+    lengths = np.concatenate([result[1] for result in results])
+
+    return {"sessions": sessions,
+            "ruin_probability": float(np.mean(balances <= 0)),
+            "session_length": summarize(lengths),
+            "final_balance": summarize(balances),
+            "lengths": lengths,
+            "balances": balances}
+
+
+def main():
+    results = simulate_sessions(sessions=100_000, seed=42, bet=5, target=200)
+
+    print("****************************")
+    print(f"Sessions:          {results['sessions']:,}")
+    print(f"Ruin probability:  {results['ruin_probability']:.2%}")
+    for name in ("session_length", "final_balance"):
+        stats = results[name]
+        print(f"{name.replace('_', ' ').capitalize()}: mean {stats['mean']:.1f} | "
+              f"median {stats['median']:.0f} | p95 {stats['p95']:.0f} | max {stats['max']}")
+    print("****************************")
+
+
+if __name__ == '__main__':
+    main()
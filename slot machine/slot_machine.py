@@ -1,10 +1,15 @@
+import os
 import random
 import time
 
+from paytable import Paytable
+
+paytable = Paytable.load(os.path.join(os.path.dirname(__file__), "paytable.json"))
+symbols = paytable.symbols
+
 def spin_row():
-    symbols = ['🍒', '🍉', '🍋', '🔔',  '⭐']
     # results = []
-    return [random.choice(symbols) for _ in range(3)]
+    return [random.choice(symbols) for _ in range(paytable.reels)]
     # for symbol in range(3):
     #     results.append(random.choice(symbols))
     # return results
@@ -15,24 +20,13 @@ def print_row(row):
     print("****************************")
 
 def get_payout(row, bet):
-    if row[0] == row[1] == row[2]:
-        if row[0] == "🍒":
-            return bet * 3
-        elif row[0] == "🍉":
-            return bet * 4
-        elif row[0] == "🍋":
-            return bet * 5
-        elif row[0] == "🔔":
-            return bet * 10
-        elif row[0] == "⭐":
-            return bet * 20
-    return 0
+    return paytable.payout(paytable.index(row), bet).item()
 
 def main():
     balance = 100
     print("****************************")
     print("Welcome to Python Slots")
-    print("Symbols: 🍒 🍉 🍋 🔔 ⭐")
+    print(f"Symbols: {' '.join(symbols)}")
     print("****************************")
 
     while balance > 0:
@@ -0,0 +1,83 @@
+# Monte Carlo simulator for the slot machine
+# Spins millions of rows at once as NumPy arrays instead of one spin per input()
+
+import numpy as np
+
+from slot_machine import paytable, symbols, get_payout
+
+
+def spin_rows(spins, rng, reels=paytable.reels):
+    # each row is a list of symbol indices, e.g. [0, 0, 4] -> 🍒 🍒 ⭐
+    return rng.integers(0, len(symbols), size=(spins, reels), dtype=np.int8)
+
+
+def get_payouts(rows, bet):
+    return paytable.payout(rows, bet)
+
+
+def to_symbols(row):
+    return [symbols[i] for i in row]
+
+
+def theoretical_rtp():
+    return paytable.expected_rtp()
+
+
+def simulate(spins=1_000_000, bet=1, seed=None, batch_size=1_000_000):
+    rng = np.random.default_rng(seed)
+    total_payout = 0
+    total_squared = 0
+    hits = 0
+    done = 0
+
+    # work in batches so memory stays the same for any number of spins
+    while done < spins:
+        size = min(batch_size, spins - done)
+        payouts = get_payouts(spin_rows(size, rng), bet)
+        total_payout += payouts.sum().item()
+        total_squared += (payouts * payouts).sum().item()
+        hits += int(np.count_nonzero(payouts))
+        done += size
+
+    total_bet = spins * bet
+    mean = total_payout / spins
+
+    return {"spins": spins,
+            "total_bet": total_bet,
+            "total_payout": total_payout,
+            "rtp": total_payout / total_bet,
+            "hit_frequency": hits / spins,
+            "variance": total_squared / spins - mean ** 2}
+
+
+def all_rows(reels=paytable.reels):
+    # every possible row once, e.g. 5 symbols on 3 reels is 125 rows
+    return np.indices((len(symbols),) * reels).reshape(reels, -1).T.astype(np.int8)
+
+
+def check_payouts(rows, bet):
+    # the vectorized payouts must match get_payout() for the same symbols
+    payouts = get_payouts(rows, bet)
+    for row, payout in zip(rows, payouts):
+        if get_payout(to_symbols(row), bet) != payout:
+            return False
+    return True
+
+
+def main():
+    spins = 10_000_000
+    if not check_payouts(all_rows(), bet=1):
+        raise RuntimeError("Vectorized payouts don't match get_payout()")
+    results = simulate(spins, bet=1, seed=42)
+
+    print("****************************")
+    print(f"Spins:          {results['spins']:,}")
+    print(f"RTP:            {results['rtp']:.4%} (expected {theoretical_rtp():.4%})")
+    print(f"Hit frequency:  {results['hit_frequency']:.4%}")
+    print(f"Variance:       {results['variance']:.4f}")
+    print(f"Payouts checked against get_payout() for all {len(all_rows())} rows")
+    print("****************************")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# Compound interest for many scenarios at once
+# Every principal is combined with every rate and every term with NumPy
+# broadcasting, so a whole table of answers is one calculation:
+#   grid[p, r, t] = balance for principals[p] at rates[r] after years[t]
+# With periods_per_year=1 and no contribution this is the same as
+#   principle * pow(1 + rate / 100, time) from compound_interest_calculator.py
+
+import time
+
+import numpy as np
+
+
+def check(name, values):
+    if np.any(values < 0):
+        raise ValueError(f"{name} can't be less than zero")
+
+
+def compound_grid(principals, rates, years, periods_per_year=1, contribution=0):
+    # contribution is added at the end of every period
+    # single numbers work too and give a 1 x 1 x 1 grid
+    principals = np.atleast_1d(np.asarray(principals, dtype=np.float64))
+    rates = np.atleast_1d(np.asarray(rates, dtype=np.float64))
+    years = np.atleast_1d(np.asarray(years, dtype=np.float64))
+    check("Principle", principals)
+    check("Interest rate", rates)
+    check("Time", years)
+
+    rate = rates[None, :, None] / 100 / periods_per_year
+    periods = years[None, None, :] * periods_per_year
+    growth = (1 + rate) ** periods
+
+    # (growth - 1) / rate is the number of periods when the rate is 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        contributions = np.where(rate == 0, periods, (growth - 1) / rate)
+
+    return principals[:, None, None] * growth + contribution * contributions
+
+
+def amortization_schedule(principal, rate, years, periods_per_year=12):
+    # a loan paid back in equal payments, one row per payment
+    check("Principle", np.asarray(principal))
+    check("Interest rate", np.asarray(rate))
+    periods = int(round(years * periods_per_year))
+    if periods <= 0:
+        raise ValueError("Time must be greater than zero")
+
+    rate = rate / 100 / periods_per_year
+    number = np.arange(1, periods + 1)
+
+    if rate == 0:
+        payment = principal / periods
+        balance = principal - payment * number
+    else:
+        payment = principal * rate / (1 - (1 + rate) ** -periods)
+        growth = (1 + rate) ** number
+        balance = principal * growth - payment * (growth - 1) / rate
+
+    balance = np.maximum(balance, 0)  # no -0.000001 on the last row
+    previous = np.concatenate(([principal], balance[:-1]))
+    interest = previous * rate
+
+    return {"period": number,
+            "payment": np.full(periods, payment),
+            "interest": interest,
+            "principal": payment - interest,
+            "balance": balance}
+
+
+def main():
+    principals = np.linspace(1_000, 100_000, 100)
+    rates = np.linspace(0, 15, 61)
+    years = np.arange(1, 41)
+
+    start = time.perf_counter()
+    grid = compound_grid(principals, rates, years, periods_per_year=12, contribution=100)
+    seconds = time.perf_counter() - start
+
+    print(f"{grid.size:,} scenarios in {seconds * 1000:.1f}ms")
+    print(f"$1,000 at 5% for 10 years, monthly, +$100 a month: ${grid[0, 20, 9]:,.2f}")
+
+    schedule = amortization_schedule(200_000, 6, 30)
+    print(f"$200,000 loan at 6% over 30 years: ${schedule['payment'][0]:,.2f} a month, "
+          f"${schedule['interest'].sum():,.2f} interest in total")
+
+
+if __name__ == "__main__":
+    main()